@@ -0,0 +1,239 @@
+"""
+Behavioural tests for VideoFilter.
+
+The filter's hot loop is tuned heavily for speed (per-batch context,
+cheapest-first checks, a prefix-trie keyword matcher, streaming). These
+tests pin what it decides and how it counts, so performance work can't
+silently change which videos get added to the playlist.
+"""
+import unittest
+from datetime import datetime, timedelta
+
+from yt_sub_playlist.core.video_filtering import KEYWORD_TRIE_MIN_KEYWORDS, VideoFilter
+
+
+class FakeCache:
+    def __init__(self, processed=()):
+        self._cache = {video_id: {} for video_id in processed}
+
+    def is_processed(self, video_id):
+        return video_id in self._cache
+
+    def get_all_processed(self):
+        return self._cache.keys()
+
+
+def _published(hours_ago):
+    return (datetime.utcnow() - timedelta(hours=hours_ago)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _video(video_id, title="A video", channel_id="UC1", duration=300, hours_ago=1, live="none"):
+    return {
+        "video_id": video_id,
+        "title": title,
+        "channel_id": channel_id,
+        "channel_title": f"Channel {channel_id}",
+        "published_at": _published(hours_ago),
+        "duration_seconds": duration,
+        "live_broadcast": live,
+    }
+
+
+BASE_CONFIG = {
+    "min_duration_seconds": 60,
+    "max_duration_seconds": 3600,
+    "lookback_hours": 24,
+    "skip_live_content": True,
+    "channel_filter_mode": "none",
+    "channel_allowlist": None,
+    "channel_blocklist": None,
+}
+
+
+class VideoFilterTests(unittest.TestCase):
+    def _filter(self, videos, processed=(), whitelist=None, **overrides):
+        video_filter = VideoFilter(dict(BASE_CONFIG, **overrides), FakeCache(processed))
+        passed = [v["video_id"] for v in video_filter.filter_videos(videos, whitelist)]
+        return passed, video_filter.get_filtering_stats()
+
+    def test_each_rejection_reason_is_counted(self):
+        videos = [
+            _video("ok"),
+            _video("short", duration=10),
+            _video("long", duration=9000),
+            _video("old", hours_ago=100),
+            _video("live", live="live"),
+            _video("done"),
+        ]
+
+        passed, stats = self._filter(videos, processed={"done"})
+
+        self.assertEqual(passed, ["ok"])
+        self.assertEqual(stats["total"], 6)
+        self.assertEqual(stats["already_processed"], 1)
+        self.assertEqual(stats["too_short"], 1)
+        self.assertEqual(stats["too_long"], 1)
+        self.assertEqual(stats["outside_date_range"], 1)
+        self.assertEqual(stats["live_content_skipped"], 1)
+        self.assertEqual(stats["passed_filters"], 1)
+
+    def test_all_cached_batch_passes_nothing(self):
+        videos = [_video("a"), _video("b")]
+
+        passed, stats = self._filter(videos, processed={"a", "b"})
+
+        self.assertEqual(passed, [])
+        self.assertEqual(stats["total"], 2)
+        self.assertEqual(stats["already_processed"], 2)
+
+    def test_allowlist_and_legacy_whitelist(self):
+        videos = [_video("a", channel_id="UC1"), _video("b", channel_id="UC2")]
+
+        passed, stats = self._filter(
+            videos, channel_filter_mode="allowlist", channel_allowlist=["UC2"]
+        )
+        self.assertEqual(passed, ["b"])
+        self.assertEqual(stats["not_in_allowlist"], 1)
+        self.assertEqual(stats["not_whitelisted"], 1)
+
+        passed, _ = self._filter(videos, whitelist={"UC1"})
+        self.assertEqual(passed, ["a"])
+
+    def test_blocklist(self):
+        videos = [_video("a", channel_id="UC1"), _video("b", channel_id="UC2")]
+
+        passed, stats = self._filter(
+            videos, channel_filter_mode="blocklist", channel_blocklist=["UC1"]
+        )
+
+        self.assertEqual(passed, ["b"])
+        self.assertEqual(stats["in_blocklist"], 1)
+
+    def test_rejection_counted_under_first_failing_check(self):
+        # Cheap checks run first: a live upload from a blocked channel is
+        # counted as live content, not as blocked
+        videos = [_video("a", channel_id="UC1", live="live", hours_ago=100)]
+
+        passed, stats = self._filter(
+            videos, channel_filter_mode="blocklist", channel_blocklist=["UC1"]
+        )
+
+        self.assertEqual(passed, [])
+        self.assertEqual(stats["live_content_skipped"], 1)
+        self.assertEqual(stats["in_blocklist"], 0)
+        self.assertEqual(stats["outside_date_range"], 0)
+
+    def test_keyword_include_and_exclude(self):
+        videos = [
+            _video("rust", title="Rust Tutorial"),
+            _video("spam", title="Rust SPAM"),
+            _video("other", title="Cooking"),
+        ]
+
+        passed, stats = self._filter(
+            videos,
+            keyword_filter_mode="both",
+            keyword_include=["rust"],
+            keyword_exclude=["spam"],
+        )
+
+        self.assertEqual(passed, ["rust"])
+        self.assertEqual(stats["keyword_filtered_include"], 1)
+        self.assertEqual(stats["keyword_filtered_exclude"], 1)
+
+    def test_keyword_match_all_and_case_sensitive(self):
+        videos = [
+            _video("both", title="Rust Tutorial"),
+            _video("one", title="Rust news"),
+        ]
+
+        passed, _ = self._filter(
+            videos,
+            keyword_filter_mode="include",
+            keyword_include=["rust", "TUTORIAL"],
+            keyword_match_type="all",
+        )
+        self.assertEqual(passed, ["both"])
+
+        passed, _ = self._filter(
+            videos,
+            keyword_filter_mode="include",
+            keyword_include=["rust"],
+            keyword_case_sensitive=True,
+        )
+        self.assertEqual(passed, [])
+
+    def test_long_keyword_lists_match_like_short_ones(self):
+        # Long lists switch to a compiled prefix-trie regex; results must not change
+        filler = [f"filler{i}" for i in range(KEYWORD_TRIE_MIN_KEYWORDS)]
+        videos = [
+            _video("rust", title="Rusty (C++) tips"),
+            _video("spam", title="Rust SPAM"),
+            _video("other", title="Cooking"),
+        ]
+
+        passed, stats = self._filter(
+            videos,
+            keyword_filter_mode="both",
+            keyword_include=filler + ["rust", "c++"],
+            keyword_exclude=filler + ["spam"],
+        )
+
+        self.assertEqual(passed, ["rust"])
+        self.assertEqual(stats["keyword_filtered_include"], 1)
+        self.assertEqual(stats["keyword_filtered_exclude"], 1)
+
+    def test_very_long_keyword_falls_back_to_plain_matching(self):
+        # Too deep for the trie regex; must still filter instead of raising
+        filler = [f"filler{i}" for i in range(KEYWORD_TRIE_MIN_KEYWORDS)]
+        long_keyword = "ab" * 1000
+        videos = [_video("long", title="x" + long_keyword), _video("rust", title="Rust"), _video("other")]
+
+        passed, _ = self._filter(
+            videos,
+            keyword_filter_mode="include",
+            keyword_include=filler + ["rust", long_keyword],
+        )
+
+        self.assertEqual(passed, ["long", "rust"])
+
+    def test_lookback_accepts_offset_timestamps(self):
+        # "Z" timestamps are compared as strings; other ISO forms are parsed
+        recent = _video("recent")
+        recent["published_at"] = recent["published_at"].replace("Z", "+00:00")
+        old = _video("old", hours_ago=100)
+        old["published_at"] = old["published_at"].replace("Z", "+00:00")
+
+        passed, stats = self._filter([recent, old, _video("z")])
+
+        self.assertEqual(passed, ["recent", "z"])
+        self.assertEqual(stats["outside_date_range"], 1)
+
+    def test_date_range_mode(self):
+        today = datetime.utcnow()
+        videos = [_video("recent", hours_ago=1), _video("ancient", hours_ago=24 * 30)]
+
+        passed, stats = self._filter(
+            videos,
+            date_filter_mode="date_range",
+            date_filter_start=(today - timedelta(days=10)).strftime("%Y-%m-%d"),
+            date_filter_end=today.strftime("%Y-%m-%d"),
+        )
+
+        self.assertEqual(passed, ["recent"])
+        self.assertEqual(stats["outside_date_range"], 1)
+
+    def test_streaming_matches_list_filtering(self):
+        videos = [_video("a"), _video("b", duration=5), _video("c"), _video("d")]
+        video_filter = VideoFilter(dict(BASE_CONFIG), FakeCache({"c"}))
+
+        streamed = [v["video_id"] for v in video_filter.iter_filter_videos(iter(videos))]
+        streamed_stats = video_filter.get_filtering_stats()
+        listed = [v["video_id"] for v in video_filter.filter_videos(videos)]
+
+        self.assertEqual(streamed, listed)
+        self.assertEqual(streamed_stats, video_filter.get_filtering_stats())
+
+
+if __name__ == "__main__":
+    unittest.main()
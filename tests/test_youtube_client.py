@@ -0,0 +1,365 @@
+"""
+Behavioural tests for YouTubeClient against an in-memory fake of the API.
+
+The client pipelines, batches and pools its API calls for speed. These
+tests pin what callers get back (which videos, in what order, with which
+success flags) and how many calls it costs, so that plumbing can change
+without silently dropping videos or spending extra quota.
+"""
+import json
+import os
+import shutil
+import socket
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from googleapiclient.errors import HttpError
+
+from yt_sub_playlist.core import youtube_client
+from yt_sub_playlist.core.youtube_client import YouTubeClient
+
+CUTOFF = "2024-01-01T00:00:00Z"
+
+
+class FakeResponse(dict):
+    def __init__(self, status):
+        super().__init__({"status": str(status), "content-type": "application/json"})
+        self.status = status
+        self.reason = "error"
+
+
+def _http_error(status, reason):
+    content = json.dumps({"error": {"message": reason, "errors": [{"reason": reason}]}})
+    return HttpError(FakeResponse(status), content.encode("utf-8"))
+
+
+class FakeRequest:
+    def __init__(self, handler, stall_url=None):
+        self._handler = handler
+        self._stall_url = stall_url
+
+    def execute(self, http=None):
+        if self._stall_url is not None:
+            # Never answered; only the transport's timeout gets us out
+            http.request(self._stall_url)
+        return self._handler()
+
+
+class FakeBatch:
+    def __init__(self, service, callback):
+        self._service = service
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id=None):
+        self._requests.append((request_id, request))
+
+    def execute(self, http=None):
+        self._service.calls["batch"] += 1
+        for request_id, request in self._requests:
+            try:
+                response, exception = request.execute(http), None
+            except HttpError as e:
+                response, exception = None, e
+            self._callback(request_id, response, exception)
+
+
+class _Resource:
+    def __init__(self, **methods):
+        self.__dict__.update(methods)
+
+
+class FakeYouTube:
+    """
+    Just enough of the YouTube Data API for the subscription scan and
+    playlist inserts.
+
+    Channel ``UC<n>`` has uploads playlist ``UU<n>`` holding
+    ``uploads_per_channel`` recent videos named ``UU<n>-v<j>``. Any other
+    playlist ID is the target playlist, holding ``playlist`` (initial
+    contents plus whatever was inserted).
+    """
+
+    def __init__(self, channel_count=3, uploads_per_channel=2):
+        self.channel_ids = [f"UC{n:03d}" for n in range(channel_count)]
+        self.uploads_per_channel = uploads_per_channel
+        self.calls = {
+            "batch": 0, "playlists.list": 0, "playlistItems.list": 0,
+            "videos.list": 0, "playlistItems.insert": 0,
+        }
+        self.stall_url = None
+        self.stalled_playlists = set()  # uploads playlist IDs whose requests hang
+        self.missing_videos = set()
+        self.insert_errors = {}  # video ID -> list of exceptions, raised in order
+        self.quota_after_inserts = None
+        self.playlist = []
+        self.videos_list_ids = []
+
+    def subscriptions(self):
+        def list_(**kwargs):
+            items = [
+                {"snippet": {"title": f"Channel {channel_id}", "resourceId": {"channelId": channel_id}}}
+                for channel_id in self.channel_ids
+            ]
+            return FakeRequest(lambda: {"items": items})
+        return _Resource(list=list_)
+
+    def playlists(self):
+        def list_(id, **kwargs):
+            def handler():
+                self.calls["playlists.list"] += 1
+                return {"items": [{
+                    "etag": f"etag-{len(self.playlist)}",
+                    "contentDetails": {"itemCount": len(self.playlist)},
+                }]}
+            return FakeRequest(handler)
+        return _Resource(list=list_)
+
+    def playlistItems(self):
+        def list_(playlistId, maxResults, **kwargs):
+            def handler():
+                self.calls["playlistItems.list"] += 1
+                if not playlistId.startswith("UU"):
+                    return {"items": [
+                        {"contentDetails": {"videoId": video_id}} for video_id in self.playlist
+                    ]}
+                return {"items": [
+                    {
+                        "contentDetails": {"videoId": f"{playlistId}-v{j}"},
+                        "snippet": {
+                            "title": f"Video {j}",
+                            "channelId": "UC" + playlistId[2:],
+                            "publishedAt": f"2024-06-01T00:00:0{j}Z",
+                        },
+                    }
+                    for j in range(min(self.uploads_per_channel, maxResults))
+                ]}
+            stall_url = self.stall_url if playlistId in self.stalled_playlists else None
+            return FakeRequest(handler, stall_url)
+
+        def insert(part, body, **kwargs):
+            video_id = body["snippet"]["resourceId"]["videoId"]
+
+            def handler():
+                self.calls["playlistItems.insert"] += 1
+                if (
+                    self.quota_after_inserts is not None
+                    and self.calls["playlistItems.insert"] > self.quota_after_inserts
+                ):
+                    raise _http_error(403, "quotaExceeded")
+                errors = self.insert_errors.get(video_id)
+                if errors:
+                    raise errors.pop(0)
+                self.playlist.append(video_id)
+                return {"id": f"item-{video_id}"}
+            return FakeRequest(handler)
+
+        return _Resource(list=list_, insert=insert)
+
+    def videos(self):
+        def list_(id, **kwargs):
+            video_ids = id.split(",")
+
+            def handler():
+                self.calls["videos.list"] += 1
+                self.videos_list_ids.append(video_ids)
+                return {"items": [
+                    {
+                        "id": video_id,
+                        "contentDetails": {"duration": "PT5M"},
+                        "snippet": {"liveBroadcastContent": "none"},
+                    }
+                    for video_id in video_ids
+                    if video_id not in self.missing_videos
+                ]}
+            return FakeRequest(handler)
+        return _Resource(list=list_)
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(self, callback)
+
+
+class YouTubeClientTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_dir, ignore_errors=True)
+        youtube_client.api_call_counter.clear()
+        self.addCleanup(youtube_client.api_call_counter.clear)
+
+    def _client(self, service):
+        client = self._real_transport_client(service)
+        # The fake ignores the transport, so skip building real HTTP objects
+        client._thread_http = lambda: None
+        return client
+
+    def _real_transport_client(self, service):
+        with patch.object(youtube_client, "get_credentials", return_value=object()), \
+                patch.object(youtube_client, "get_authenticated_service", return_value=service):
+            return YouTubeClient(data_dir=self.data_dir)
+
+
+class SubscriptionScanTests(YouTubeClientTestCase):
+    def _scan(self, service):
+        client = self._client(service)
+        return [v["video_id"] for v in client.iter_recent_uploads_from_subscriptions(CUTOFF, 5)]
+
+    def test_yields_every_channel_in_subscription_order(self):
+        service = FakeYouTube(channel_count=3)
+
+        videos = self._scan(service)
+
+        self.assertEqual(videos, [
+            "UU000-v0", "UU000-v1", "UU001-v0", "UU001-v1", "UU002-v0", "UU002-v1",
+        ])
+        self.assertEqual(service.calls["batch"], 1)
+
+    def test_one_channel_stalling_only_drops_that_channel(self):
+        # Accepts connections but never answers them
+        server = socket.create_server(("127.0.0.1", 0))
+        self.addCleanup(server.close)
+        service = FakeYouTube(channel_count=3)
+        service.stall_url = "http://127.0.0.1:%d/" % server.getsockname()[1]
+        service.stalled_playlists.add("UU001")
+
+        client = self._real_transport_client(service)
+        transport = client._thread_http().http
+        transport.timeout = 0.2  # the real transport's timeout, shortened
+        client._thread_http = lambda: transport
+        videos = [v["video_id"] for v in client.iter_recent_uploads_from_subscriptions(CUTOFF, 5)]
+
+        # The stall fails the batch, then that channel's own retry; the
+        # other channels are refetched individually and still come through
+        self.assertEqual(videos, ["UU000-v0", "UU000-v1", "UU002-v0", "UU002-v1"])
+
+
+def _upload_item(video_id, channel_id):
+    return {
+        "contentDetails": {"videoId": video_id},
+        "snippet": {"title": video_id, "channelId": channel_id, "publishedAt": "2024-06-01T00:00:00Z"},
+    }
+
+
+class AttachVideoDetailsTests(YouTubeClientTestCase):
+    def test_one_videos_list_call_per_fifty_ids_in_channel_order(self):
+        service = FakeYouTube()
+        # 7 channels x 15 uploads, plus one video shared by two channels
+        channel_items = [
+            (f"Channel {c}", [_upload_item(f"c{c}-v{j:02d}", f"UC{c}") for j in range(15)])
+            for c in range(7)
+        ]
+        channel_items[3][1].append(_upload_item("c0-v00", "UC3"))
+        service.missing_videos = {"c2-v05", "c6-v14"}
+
+        videos = list(self._client(service)._attach_video_details(iter(channel_items)))
+
+        expected = [
+            (title, item["contentDetails"]["videoId"])
+            for title, items in channel_items
+            for item in items
+            if item["contentDetails"]["videoId"] not in service.missing_videos
+        ]
+        self.assertEqual([(v["channel_title"], v["video_id"]) for v in videos], expected)
+        # 105 distinct IDs: two full batches and the remainder
+        self.assertEqual([len(ids) for ids in service.videos_list_ids], [50, 50, 5])
+        looked_up = [video_id for ids in service.videos_list_ids for video_id in ids]
+        self.assertEqual(len(looked_up), len(set(looked_up)))
+        self.assertEqual(videos[0]["duration_seconds"], 300)
+
+
+class PlaylistCacheTests(YouTubeClientTestCase):
+    def test_own_inserts_keep_the_playlist_cache_valid(self):
+        service = FakeYouTube()
+        service.playlist = ["old1", "old2"]
+        self._client(service).add_videos_to_playlist("PL1", ["old1", "new1", "new2"])
+        self.assertEqual(service.calls["playlistItems.list"], 1)
+
+        # Next run: the signature matches the re-saved cache, so no paging
+        existing = self._client(service).fetch_existing_playlist_items("PL1")
+
+        self.assertEqual(existing, {"old1", "old2", "new1", "new2"})
+        self.assertEqual(service.calls["playlistItems.list"], 1)
+
+
+class AddVideosToPlaylistTests(YouTubeClientTestCase):
+    def test_every_video_is_inserted_in_batches_of_fifty(self):
+        service = FakeYouTube()
+        video_ids = [f"v{n:03d}" for n in range(120)]
+
+        results = self._client(service).add_videos_to_playlist("PL1", video_ids)
+
+        self.assertEqual(results, dict.fromkeys(video_ids, True))
+        # YouTube may apply a batch's inserts in any order, so only membership counts
+        self.assertEqual(sorted(service.playlist), video_ids)
+        self.assertEqual(service.calls["batch"], 3)
+
+    def test_duplicates_are_reported_as_added_without_inserting(self):
+        service = FakeYouTube()
+        service.playlist = ["a", "b"]
+        service.insert_errors["d"] = [_http_error(409, "videoAlreadyInPlaylist")]
+
+        results = self._client(service).add_videos_to_playlist("PL1", ["a", "c", "a", "b", "d"])
+
+        self.assertEqual(results, {"a": True, "b": True, "c": True, "d": True})
+        self.assertEqual(service.calls["playlistItems.insert"], 2)
+        self.assertEqual(service.playlist, ["a", "b", "c"])
+
+    def test_aborted_insert_is_retried_individually(self):
+        service = FakeYouTube()
+        service.insert_errors["v1"] = [_http_error(409, "SERVICE_UNAVAILABLE")]
+
+        results = self._client(service).add_videos_to_playlist("PL1", ["v0", "v1", "v2"])
+
+        self.assertEqual(results, {"v0": True, "v1": True, "v2": True})
+        self.assertEqual(service.calls["playlistItems.insert"], 4)
+        self.assertEqual(sorted(service.playlist), ["v0", "v1", "v2"])
+
+    def test_quota_running_out_mid_batch_fails_the_rest_without_sending(self):
+        service = FakeYouTube()
+        service.quota_after_inserts = 60
+        video_ids = [f"v{n:03d}" for n in range(120)]
+
+        results = self._client(service).add_videos_to_playlist("PL1", video_ids)
+
+        self.assertEqual(list(results), video_ids)
+        self.assertEqual([video_id for video_id, added in results.items() if added], video_ids[:60])
+        self.assertEqual(service.calls["batch"], 2)
+        self.assertEqual(service.calls["playlistItems.insert"], 100)
+
+
+class TransportTests(YouTubeClientTestCase):
+    def test_thread_transport_has_a_finite_timeout(self):
+        transport = self._real_transport_client(FakeYouTube())._thread_http().http
+
+        self.assertIsNotNone(transport.timeout)
+        self.assertGreater(transport.timeout, 0)
+        self.assertNotIn(308, transport.redirect_codes)
+
+    def test_etag_cache_is_kept_on_the_timeout_transport(self):
+        transport = self._real_transport_client(FakeYouTube())._thread_http().http
+
+        self.assertEqual(transport.cache.cache, os.path.join(self.data_dir, "http_cache"))
+        self.assertIsNotNone(transport.timeout)
+
+
+class HttpCacheTests(YouTubeClientTestCase):
+    def test_entries_unused_for_too_long_are_pruned_at_startup(self):
+        cache_dir = os.path.join(self.data_dir, "http_cache")
+        os.makedirs(cache_dir)
+        stale = os.path.join(cache_dir, "stale")
+        fresh = os.path.join(cache_dir, "fresh")
+        for path in (stale, fresh):
+            with open(path, "w") as f:
+                f.write("cached response")
+        too_old = youtube_client.HTTP_CACHE_MAX_AGE_DAYS * 86400 + 60
+        old_mtime = os.path.getmtime(stale) - too_old
+        os.utime(stale, (old_mtime, old_mtime))
+
+        self._client(FakeYouTube())
+
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(fresh))
+
+
+if __name__ == "__main__":
+    unittest.main()
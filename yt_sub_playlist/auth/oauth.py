@@ -11,6 +11,7 @@ This module manages the OAuth2 flow for YouTube API access, including:
 import logging
 import os
 import pickle
+from functools import lru_cache
 from pathlib import Path
 
 from google.auth.exceptions import RefreshError
@@ -30,10 +31,13 @@ SCOPES = [
 TOKEN_FILE = "token.json"
 CREDENTIALS_FILE = "client_secrets.json"
 
+# Credentials loaded by this process, reused instead of re-reading TOKEN_FILE
+_credentials = None
 
-def get_authenticated_service():
+
+def get_credentials():
     """
-    Authenticate and return a YouTube API service object.
+    Load, refresh or obtain OAuth2 credentials for the YouTube API.
     
     Handles the complete OAuth2 flow including:
     - Loading existing tokens
@@ -41,16 +45,20 @@ def get_authenticated_service():
     - Running new authentication flow if needed
     - Saving tokens for future use
 
+    Credentials are kept for the life of the process, so later calls only
+    touch the token file when a refresh or new flow is needed.
+
     Returns:
-        googleapiclient.discovery.Resource: Authenticated YouTube API service
+        google.oauth2.credentials.Credentials: Valid user credentials
 
     Raises:
         SystemExit: If authentication fails completely
     """
-    creds = None
+    global _credentials
+    creds = _credentials
 
     # Load existing token if it exists
-    if os.path.exists(TOKEN_FILE):
+    if creds is None and os.path.exists(TOKEN_FILE):
         try:
             with open(TOKEN_FILE, "rb") as token:
                 creds = pickle.load(token)
@@ -98,8 +106,46 @@ def get_authenticated_service():
         except Exception as e:
             logger.warning(f"Failed to save credentials: {e}")
 
+    _credentials = creds
+    return creds
+
+
+@lru_cache(maxsize=4)
+def _build_service(creds):
+    """
+    Build the YouTube API service once per credentials object.
+
+    Uses the discovery document bundled with google-api-python-client
+    instead of fetching it, and skips the discovery file cache (which
+    only applies to fetched documents).
+    """
+    return build(
+        "youtube", "v3", credentials=creds,
+        static_discovery=True, cache_discovery=False
+    )
+
+
+def get_authenticated_service(credentials=None):
+    """
+    Authenticate and return a YouTube API service object.
+
+    The service is cached per credentials object, so repeated calls in one
+    process reuse the already parsed API description.
+
+    Args:
+        credentials: Credentials from ``get_credentials()``; loaded (and the
+            OAuth2 flow run if needed) when not given
+
+    Returns:
+        googleapiclient.discovery.Resource: Authenticated YouTube API service
+
+    Raises:
+        SystemExit: If authentication fails completely
+    """
+    creds = credentials or get_credentials()
+
     try:
-        service = build("youtube", "v3", credentials=creds)
+        service = _build_service(creds)
         logger.debug("YouTube API service created successfully")
         return service
     except Exception as e:
@@ -119,7 +165,9 @@ def test_authentication():
     """
     try:
         service = get_authenticated_service()
-        response = service.channels().list(part="snippet", mine=True).execute()
+        response = service.channels().list(
+            part="snippet", mine=True, fields="items/snippet/title"
+        ).execute()
 
         if "items" in response and response["items"]:
             channel = response["items"][0]["snippet"]
@@ -143,6 +191,10 @@ def reset_authentication():
     This forces a fresh authentication flow on the next API call.
     Useful when authentication issues occur or when switching accounts.
     """
+    global _credentials
+    _credentials = None
+    _build_service.cache_clear()
+
     try:
         if os.path.exists(TOKEN_FILE):
             os.remove(TOKEN_FILE)
@@ -12,11 +12,17 @@ import json
 import logging
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import AbstractSet, Any, Dict, FrozenSet, Optional, Set
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Optional speedup: `uv sync --extra fast`
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Cache configuration
@@ -27,6 +33,20 @@ CACHE_TTL_DAYS = 30
 CONFIG_JSON_PATH = Path("config.json")
 
 
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object as compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
 def load_config_json() -> Dict[str, Any]:
     """
     Load user preferences from config.json file.
@@ -133,7 +153,9 @@ def _merge_channel_whitelist(env_whitelist: Optional[str], json_whitelist: Optio
     """
     # .env takes precedence
     if env_whitelist:
-        return parse_channel_whitelist(env_whitelist)
+        # Copy the memoized frozenset; callers expect a plain, mutable set
+        channel_ids = parse_channel_whitelist(env_whitelist)
+        return set(channel_ids) if channel_ids else None
 
     # Fall back to config.json
     if json_whitelist and isinstance(json_whitelist, list):
@@ -143,24 +165,27 @@ def _merge_channel_whitelist(env_whitelist: Optional[str], json_whitelist: Optio
     return None
 
 
-def parse_channel_whitelist(whitelist_str: Optional[str]) -> Optional[Set[str]]:
+@lru_cache(maxsize=8)
+def parse_channel_whitelist(whitelist_str: Optional[str]) -> Optional[FrozenSet[str]]:
     """
     Parse comma-separated channel ID whitelist from environment variable.
 
+    Memoized; returns a frozenset so the shared cached value can't be mutated.
+
     Args:
         whitelist_str: Comma-separated string of channel IDs, or None
 
     Returns:
-        Set of channel IDs, or None if no whitelist specified
+        Frozenset of channel IDs, or None if no whitelist specified
     """
     if not whitelist_str or not whitelist_str.strip():
         return None
 
-    channel_ids = {
+    channel_ids = frozenset(
         channel_id.strip()
         for channel_id in whitelist_str.split(',')
         if channel_id.strip()
-    }
+    )
 
     return channel_ids if channel_ids else None
 
@@ -179,7 +204,9 @@ def _merge_channel_list(env_list: Optional[str], json_list: Optional[Any]) -> Op
     """
     # .env takes precedence
     if env_list:
-        return parse_channel_whitelist(env_list)
+        # Copy the memoized frozenset; callers expect a plain, mutable set
+        channel_ids = parse_channel_whitelist(env_list)
+        return set(channel_ids) if channel_ids else None
 
     # Fall back to config.json
     if json_list and isinstance(json_list, list):
@@ -275,8 +302,8 @@ class VideoCache:
             return
         
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                raw_cache = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                raw_cache = _json_loads(f.read())
             
             # Garbage collect expired entries
             cutoff = (datetime.utcnow() - timedelta(days=self.ttl_days)).isoformat()
@@ -299,8 +326,8 @@ class VideoCache:
     def _save_cache(self) -> None:
         """Save cache to disk."""
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self._cache, f, indent=2)
+            with open(self.cache_file, 'wb') as f:
+                f.write(_json_dumps(self._cache))
             logger.debug(f"Cache saved to {self.cache_file}")
         except Exception as e:
             logger.warning(f"Failed to save cache: {e}")
@@ -309,6 +336,10 @@ class VideoCache:
         """Check if video ID has been processed."""
         return video_id in self._cache
     
+    def get_all_processed(self) -> AbstractSet[str]:
+        """Return a read-only, live view of all processed video IDs."""
+        return self._cache.keys()
+    
     def mark_processed(self, video_id: str, title: str = "", channel: str = "") -> None:
         """Mark video as processed with metadata."""
         self._cache[video_id] = {
@@ -27,6 +27,12 @@ logger = logging.getLogger(__name__)
 # so tests and downstream callers can reference it explicitly.
 DEFAULT_DATA_DIR = "yt_sub_playlist/data"
 
+# Column layout of the CSV report written by PlaylistManager.write_report
+REPORT_FIELDNAMES = (
+    'title', 'video_id', 'channel_title', 'channel_id',
+    'published_at', 'duration_seconds', 'live_broadcast', 'added',
+)
+
 
 def resolve_data_dir(explicit: str = None) -> str:
     """
@@ -91,20 +97,21 @@ class PlaylistManager:
         Returns:
             List of video metadata dicts with 'added' field indicating success
         """
-        # Step 1: Fetch recent subscription videos
+        # Step 1 + 2: Stream recent subscription videos straight through the
+        # filters so each channel is filtered while the next is being fetched
         logger.info(f"Fetching videos published after {published_after}")
-        videos = self.client.get_recent_uploads_from_subscriptions(
-            published_after=published_after,
-            max_per_channel=5
-        )
-
-        if not videos:
+        filtered_videos = list(self.filter.iter_filter_videos(
+            self.client.iter_recent_uploads_from_subscriptions(
+                published_after=published_after,
+                max_per_channel=5
+            ),
+            channel_whitelist
+        ))
+
+        if not self.filter.get_filtering_stats()["total"]:
             logger.info("No recent subscription videos found")
             return []
 
-        # Step 2: Filter videos based on criteria
-        filtered_videos = self.filter.filter_videos(videos, channel_whitelist)
-
         if not filtered_videos:
             logger.info("No videos passed filters")
             return []
@@ -138,9 +145,10 @@ class PlaylistManager:
             return []
 
         if dry_run:
-            logger.info(f"DRY RUN: Would add {len(videos)} videos to playlist {playlist_id}")
-            for video in videos:
-                logger.info(f"  - {video['title']} ({video['video_id']})")
+            logger.info("DRY RUN: Would add %d videos to playlist %s", len(videos), playlist_id)
+            if logger.isEnabledFor(logging.INFO):
+                for video in videos:
+                    logger.info("  - %s (%s)", video['title'], video['video_id'])
             # Return videos with added=True for dry run
             return [dict(video, added=True) for video in videos]
 
@@ -150,6 +158,7 @@ class PlaylistManager:
 
         # Create detailed results with metadata
         detailed_results = []
+        info_enabled = logger.isEnabledFor(logging.INFO)
         for video in videos:
             video_id = video["video_id"]
             added = results.get(video_id, False)
@@ -159,9 +168,10 @@ class PlaylistManager:
                 self.cache.mark_processed(
                     video_id, title=video["title"], channel=video["channel_title"]
                 )
-                logger.info(f"✅ Added: {video['title']}")
+                if info_enabled:
+                    logger.info("✅ Added: %s", video['title'])
             else:
-                logger.warning(f"❌ Failed to add: {video['title']}")
+                logger.warning("❌ Failed to add: %s", video['title'])
 
             # Add the 'added' field to the video metadata
             video_result = dict(video, added=added)
@@ -232,21 +242,20 @@ class PlaylistManager:
             logger.info("No videos to report")
             return
 
+        tmp_path = report_path + ".tmp"
         try:
-            # Write CSV report
+            # Write CSV report to a temp file and atomically swap it into place
+            # so a crash never leaves a truncated report behind
             os.makedirs(os.path.dirname(report_path), exist_ok=True)
-            with open(report_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = [
-                    'title', 'video_id', 'channel_title', 'channel_id',
-                    'published_at', 'duration_seconds', 'live_broadcast', 'added'
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                writer.writeheader()
-                for video in video_results:
-                    # Only write the fields we want in the CSV
-                    row = {field: video.get(field, '') for field in fieldnames}
-                    writer.writerow(row)
+            with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(REPORT_FIELDNAMES)
+                # Only write the fields we want in the CSV, in column order
+                writer.writerows(
+                    tuple(video.get(field, '') for field in REPORT_FIELDNAMES)
+                    for video in video_results
+                )
+            os.replace(tmp_path, report_path)
 
             added_count = sum(1 for v in video_results if v.get('added', False))
             logger.info(f"Report written to {report_path} ({added_count}/{len(video_results)} videos added)")
@@ -256,6 +265,8 @@ class PlaylistManager:
 
         except Exception as e:
             logger.warning(f"Failed to write report to {report_path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def _write_dashboard_json(self, video_results: List[Dict[str, Any]]) -> None:
         """
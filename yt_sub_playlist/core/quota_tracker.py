@@ -136,21 +136,24 @@ class QuotaTracker:
     
     def log_usage_summary(self):
         """Log a detailed usage summary."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         usage = self.get_session_usage()
         
         logger.info("=== Quota Usage Summary ===")
-        logger.info(f"Total quota used: {usage['total_quota_used']} / {self.daily_quota_limit} units")
-        logger.info(f"Usage percentage: {usage['usage_percentage']:.1f}%")
-        logger.info(f"Quota remaining: {usage['quota_remaining']} units")
-        logger.info(f"Total API calls: {usage['total_calls']}")
+        logger.info("Total quota used: %d / %d units", usage['total_quota_used'], self.daily_quota_limit)
+        logger.info("Usage percentage: %.1f%%", usage['usage_percentage'])
+        logger.info("Quota remaining: %d units", usage['quota_remaining'])
+        logger.info("Total API calls: %d", usage['total_calls'])
         
         if usage['methods_used']:
             logger.info("Methods breakdown:")
             for method, stats in usage['methods_used'].items():
-                logger.info(f"  {method}: {stats['calls']} calls, {stats['total_cost']} units")
-                if stats['items_processed']:
-                    efficiency = stats['items_processed'] / stats['calls']
-                    logger.info(f"    Efficiency: {efficiency:.1f} items per call")
+                logger.info("  %s: %d calls, %d units", method, stats['calls'], stats['total_cost'])
+                items_processed = stats['items_processed']
+                if items_processed:
+                    logger.info("    Efficiency: %.1f items per call", items_processed / stats['calls'])
     
     def is_quota_exceeded(self, threshold_percentage: float = 90.0) -> bool:
         """
@@ -10,17 +10,29 @@ This module handles filtering videos based on various criteria:
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+import re
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
 from ..config.env_loader import VideoCache
 
 logger = logging.getLogger(__name__)
 
+# Keyword lists at least this long are matched with a single prefix-trie
+# regex instead of one substring scan per keyword. Below it, CPython's
+# substring search beats the regex engine.
+KEYWORD_TRIE_MIN_KEYWORDS = 64
+
 
 def get_published_after_timestamp(lookback_hours: int) -> str:
     """
     Get RFC 3339 timestamp for videos published after lookback period.
+
+    The current time is truncated to the minute so repeated calls within a
+    run share one cached result.
     
     Args:
         lookback_hours: Number of hours to look back from now
@@ -28,32 +40,386 @@ def get_published_after_timestamp(lookback_hours: int) -> str:
     Returns:
         RFC 3339 formatted timestamp string for YouTube API
     """
-    published_after = datetime.utcnow() - timedelta(hours=lookback_hours)
+    now = datetime.utcnow().replace(second=0, microsecond=0)
+    return _published_after_timestamp(lookback_hours, now)
+
+
+@lru_cache(maxsize=8)
+def _published_after_timestamp(lookback_hours: int, now: datetime) -> str:
+    published_after = now - timedelta(hours=lookback_hours)
     return published_after.strftime('%Y-%m-%dT%H:%M:%SZ')
 
 
-def parse_channel_whitelist(whitelist_str: Optional[str]) -> Optional[Set[str]]:
+def _parse_published_at(published_at_str: str) -> Optional[datetime]:
+    """
+    Parse a YouTube publishedAt timestamp into a naive UTC datetime.
+
+    Uses the C-implemented ``datetime.fromisoformat`` rather than
+    ``strptime``, whose pure-Python parser dominated the date filter on
+    large batches.
+
+    Args:
+        published_at_str: RFC 3339 / ISO 8601 timestamp (e.g. "2024-01-15T12:00:00Z")
+
+    Returns:
+        Naive UTC datetime, or None if the string can't be parsed
+    """
+    try:
+        # RFC 3339 format from the YouTube API (UTC, "Z" suffix)
+        if published_at_str.endswith('Z'):
+            return datetime.fromisoformat(published_at_str[:-1])
+
+        published_at = datetime.fromisoformat(published_at_str)
+    except ValueError:
+        return None
+
+    # Normalize explicit offsets to naive UTC so they compare with the cutoffs
+    if published_at.tzinfo is not None:
+        published_at = published_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return published_at
+
+
+def _keyword_trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Build a regex that matches any of the keywords, factored by shared prefixes.
+
+    Python's ``re`` tries every branch of a flat ``a|b|c`` alternation at each
+    position; nesting branches by common prefix lets a single scan reject most
+    positions after one character. Since only "does anything match" matters,
+    branches below the end of a shorter keyword are dropped.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: Dict[str, dict]) -> str:
+        if "" in node:
+            return ""
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return render(trie)
+
+
+def _any_keyword_matcher(keywords: FrozenSet[str]) -> Callable[[str], bool]:
+    """
+    Return a predicate testing whether a text contains any of the keywords.
+
+    Args:
+        keywords: Keywords to look for (already case-normalized)
+
+    Returns:
+        Callable taking the search text and returning True on any match
+    """
+    if len(keywords) >= KEYWORD_TRIE_MIN_KEYWORDS:
+        try:
+            search = re.compile(_keyword_trie_pattern(keywords)).search
+        except (RecursionError, re.error) as e:
+            # The trie nests a level per character; very long keywords
+            # exceed the recursion limit, so use the plain scan instead
+            logger.debug("Keyword trie unavailable, scanning keywords one by one: %s", e)
+        else:
+            return lambda text: search(text) is not None
+
+    return lambda text: any(keyword in text for keyword in keywords)
+
+
+@lru_cache(maxsize=8)
+def parse_channel_whitelist(whitelist_str: Optional[str]) -> Optional[FrozenSet[str]]:
     """
     Parse comma-separated channel ID whitelist from environment variable.
+
+    Memoized; returns a frozenset so the shared cached value can't be mutated.
     
     Args:
         whitelist_str: Comma-separated string of channel IDs, or None
         
     Returns:
-        Set of channel IDs, or None if no whitelist specified
+        Frozenset of channel IDs, or None if no whitelist specified
     """
     if not whitelist_str or not whitelist_str.strip():
         return None
     
-    channel_ids = {
+    channel_ids = frozenset(
         channel_id.strip() 
         for channel_id in whitelist_str.split(',') 
         if channel_id.strip()
-    }
+    )
     
     return channel_ids if channel_ids else None
 
 
+def _intern_channel_ids(channel_ids: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """
+    Build a frozenset of interned channel IDs, or None for an empty list.
+
+    The API client interns ``channel_id`` on every video, so a matching
+    membership test hits the set's identity check instead of comparing
+    the strings.
+    """
+    if not channel_ids:
+        return None
+    return frozenset(sys.intern(channel_id) for channel_id in channel_ids)
+
+
+@dataclass(slots=True)
+class FilterContext:
+    """
+    Filter settings resolved once per batch.
+
+    Built by ``VideoFilter._build_context`` so the per-video checks read
+    plain attributes instead of re-querying the config dictionary and
+    re-normalizing keyword lists for every video.
+    """
+
+    min_duration: int
+    max_duration: Optional[int]
+    filter_mode: str
+    allowlist: Optional[FrozenSet[str]]
+    blocklist: Optional[FrozenSet[str]]
+    skip_live: bool
+    date_mode: str
+    date_start: datetime
+    date_end: datetime
+    date_start_str: str
+    date_filter_active: bool
+    keyword_mode: str
+    keyword_case_sensitive: bool
+    keyword_search_description: bool
+    keyword_match_type: str
+    include_keywords: FrozenSet[str]
+    include_any: Callable[[str], bool]
+    exclude_any: Callable[[str], bool]
+    keyword_filter_active: bool
+
+
+def _check_date_filter(video: Dict[str, Any], ctx: FilterContext) -> bool:
+    """
+    Check if video passes date filter criteria.
+
+    Args:
+        video: Video data dictionary with published_at field
+        ctx: Filter settings for the current batch
+
+    Returns:
+        True if video passes date filter, False otherwise
+    """
+    # Get video published date (assumed to be in ISO format from YouTube API)
+    published_at_str = video.get("published_at")
+    if not published_at_str:
+        # If no published date, allow video through (shouldn't happen with YouTube API)
+        return True
+
+    published_at = _parse_published_at(published_at_str)
+    if published_at is None:
+        logger.warning("Could not parse published_at date: %s", published_at_str)
+        return True
+
+    return ctx.date_start <= published_at <= ctx.date_end
+
+
+def _check_keyword_filter(video: Dict[str, Any], ctx: FilterContext) -> Optional[str]:
+    """
+    Check if video passes keyword filter criteria.
+
+    Args:
+        video: Video data dictionary with title and description fields
+        ctx: Filter settings for the current batch (keywords already
+            lowercased unless matching is case sensitive)
+
+    Returns:
+        None if passes filter
+        "filtered_include" if doesn't match include keywords
+        "filtered_exclude" if matches exclude keywords
+    """
+    mode = ctx.keyword_mode
+
+    if mode == "none":
+        return None
+
+    # Get search fields
+    title = video.get("title", "")
+    description = video.get("description", "")
+
+    # Build search text
+    search_text = title
+    if ctx.keyword_search_description and description:
+        search_text = f"{title} {description}"
+
+    # Handle case sensitivity
+    if not ctx.keyword_case_sensitive:
+        search_text = search_text.lower()
+
+    # Check include filter
+    if mode in ("include", "both"):
+        include_keywords = ctx.include_keywords
+        if include_keywords:
+            if ctx.keyword_match_type == "any":
+                # At least one keyword must match
+                if not ctx.include_any(search_text):
+                    return "filtered_include"
+            else:  # match_type == "all"
+                # All keywords must match
+                if not all(keyword in search_text for keyword in include_keywords):
+                    return "filtered_include"
+
+    # Check exclude filter
+    if mode in ("exclude", "both"):
+        # If any exclude keyword matches, filter out
+        if ctx.exclude_any(search_text):
+            return "filtered_exclude"
+
+    return None
+
+
+def _rejection_reason(video: Dict[str, Any], ctx: FilterContext) -> Optional[str]:
+    """
+    Run all per-video filters and report the first one that rejects the video.
+
+    A pure function of the video and the batch's FilterContext: it reads no
+    instance state, touches neither the cache nor the stats, so the filter
+    can be evaluated on any slice of a batch independently. The
+    already-processed check is done by the caller against the cache
+    snapshot.
+
+    Checks run cheapest first (numeric and string compares, set lookups,
+    then date parsing, then keyword scans), so most rejected videos never
+    reach the expensive ones. When several filters would reject a video, it
+    is counted under the first in this order.
+
+    Args:
+        video: Video data dictionary
+        ctx: Filter settings for the current batch
+
+    Returns:
+        The stats key for the rejecting filter, or None if the video passes
+    """
+    duration = video["duration_seconds"]
+
+    # Check duration filters
+    if duration < ctx.min_duration:
+        return "too_short"
+
+    max_duration = ctx.max_duration
+    if max_duration and duration > max_duration:
+        return "too_long"
+
+    # Check live content filter
+    if ctx.skip_live and video.get("live_broadcast", "none") != "none":
+        return "live_content_skipped"
+
+    # Check channel filtering
+    filter_mode = ctx.filter_mode
+    if filter_mode == "allowlist" and ctx.allowlist:
+        if video["channel_id"] not in ctx.allowlist:
+            return "not_in_allowlist"
+
+    elif filter_mode == "blocklist" and ctx.blocklist:
+        if video["channel_id"] in ctx.blocklist:
+            return "in_blocklist"
+
+    # Check date filter
+    if ctx.date_filter_active and not _check_date_filter(video, ctx):
+        return "outside_date_range"
+
+    # Check keyword filter
+    if ctx.keyword_filter_active:
+        keyword_result = _check_keyword_filter(video, ctx)
+        if keyword_result == "filtered_include":
+            return "keyword_filtered_include"
+        elif keyword_result == "filtered_exclude":
+            return "keyword_filtered_exclude"
+
+    return None
+
+
+def _basic_rejection_reason(video: Dict[str, Any], ctx: FilterContext) -> Optional[str]:
+    """
+    ``_rejection_reason`` specialized for batches with no channel or keyword
+    filter and an open-ended date window (the default configuration).
+
+    The date check compares the API's "...Z" publishedAt string directly
+    with the cutoff instead of parsing it; ISO 8601 strings of the same
+    layout sort chronologically. Other timestamp formats fall back to the
+    full date check.
+    """
+    duration = video["duration_seconds"]
+
+    if duration < ctx.min_duration:
+        return "too_short"
+
+    max_duration = ctx.max_duration
+    if max_duration and duration > max_duration:
+        return "too_long"
+
+    if ctx.skip_live and video.get("live_broadcast", "none") != "none":
+        return "live_content_skipped"
+
+    published_at_str = video.get("published_at")
+    if published_at_str and published_at_str[-1:] == "Z":
+        if published_at_str < ctx.date_start_str:
+            return "outside_date_range"
+    elif not _check_date_filter(video, ctx):
+        return "outside_date_range"
+
+    return None
+
+
+def _select_rejection_reason(ctx: FilterContext) -> Callable[[Dict[str, Any], FilterContext], Optional[str]]:
+    """Pick the cheapest per-video predicate that is exact for this batch's settings."""
+    channel_filter_active = (
+        (ctx.filter_mode == "allowlist" and ctx.allowlist)
+        or (ctx.filter_mode == "blocklist" and ctx.blocklist)
+    )
+    if (
+        not channel_filter_active
+        and not ctx.keyword_filter_active
+        and ctx.date_end == datetime.max
+    ):
+        return _basic_rejection_reason
+    return _rejection_reason
+
+
+_REJECTION_MESSAGES = {
+    "too_short": "Skipping too short (%ss): %s",
+    "too_long": "Skipping too long (%ss): %s",
+    "not_in_allowlist": "Skipping channel not in allowlist %s: %s",
+    "in_blocklist": "Skipping blocked channel %s: %s",
+    "outside_date_range": "Skipping outside date range: %s",
+    "keyword_filtered_include": "Skipping (not in include keywords): %s",
+    "keyword_filtered_exclude": "Skipping (matches exclude keywords): %s",
+}
+
+
+def _log_rejection(reason: str, video: Dict[str, Any], debug_enabled: bool) -> None:
+    """
+    Log why a video was filtered out (live content at INFO, the rest at DEBUG).
+
+    Only called when INFO is enabled; ``debug_enabled`` is resolved once per
+    batch by the caller.
+    """
+    title = video["title"]
+
+    if reason == "live_content_skipped":
+        live_type = "livestream" if video.get("live_broadcast") == "live" else "premiere"
+        logger.info("Skipping %s: %s", live_type, title)
+        return
+
+    if not debug_enabled:
+        return
+
+    message = _REJECTION_MESSAGES[reason]
+    if reason in ("too_short", "too_long"):
+        logger.debug(message, video["duration_seconds"], title)
+    elif reason in ("not_in_allowlist", "in_blocklist"):
+        logger.debug(message, video["channel_title"], title)
+    else:
+        logger.debug(message, title)
+
+
 class VideoFilter:
     """
     Comprehensive video filtering system.
@@ -76,6 +442,31 @@ class VideoFilter:
         self.config = config
         self.cache = cache
         self.stats = self._init_stats()
+
+        # Channel lists may arrive as lists from config.json; coerce them to
+        # frozensets once so membership checks are O(1) hash lookups. That holds
+        # for imported blocklists of tens of thousands of IDs too; a bloom
+        # filter in front would only add Python-level hashing to every probe.
+        allowlist = config.get("channel_allowlist")
+        blocklist = config.get("channel_blocklist")
+        self._allowlist = _intern_channel_ids(allowlist)
+        self._blocklist = _intern_channel_ids(blocklist)
+        self._skip_live = config["skip_live_content"]
+
+        # Normalize keyword case once instead of per video
+        self._keyword_case_sensitive = config.get("keyword_case_sensitive", False)
+        self._include_keywords = self._normalize_keywords(config.get("keyword_include"))
+        self._exclude_keywords = self._normalize_keywords(config.get("keyword_exclude"))
+        self._include_any = _any_keyword_matcher(self._include_keywords)
+        self._exclude_any = _any_keyword_matcher(self._exclude_keywords)
+
+    def _normalize_keywords(self, keywords: Optional[List[str]]) -> FrozenSet[str]:
+        """Deduplicate keywords, lowercasing them unless matching is case sensitive."""
+        if not keywords:
+            return frozenset()
+        if self._keyword_case_sensitive:
+            return frozenset(keywords)
+        return frozenset(k.lower() for k in keywords)
     
     def _init_stats(self) -> Dict[str, int]:
         """Initialize filtering statistics."""
@@ -86,7 +477,7 @@ class VideoFilter:
             "outside_date_range": 0,
             "keyword_filtered_include": 0,
             "keyword_filtered_exclude": 0,
-            "not_whitelisted": 0,  # Legacy stat name
+            "not_whitelisted": 0,  # Legacy stat name, filled in by get_filtering_stats
             "not_in_allowlist": 0,
             "in_blocklist": 0,
             "already_processed": 0,
@@ -109,163 +500,145 @@ class VideoFilter:
         Returns:
             Filtered list of videos that should be added to playlist
         """
-        self.stats = self._init_stats()
-        self.stats["total"] = len(videos)
+        return list(self.iter_filter_videos(videos, channel_whitelist))
+
+    def iter_filter_videos(
+        self,
+        videos: Iterable[Dict[str, Any]],
+        channel_whitelist: Optional[Set[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily filter videos, yielding each one as soon as it passes.
 
-        filtered = []
-        min_duration = self.config["min_duration_seconds"]
-        max_duration = self.config.get("max_duration_seconds")
+        Accepts any iterable (e.g. the generator returned by
+        ``YouTubeClient.iter_recent_uploads_from_subscriptions``) so filtering
+        overlaps with fetching. Statistics are updated incrementally and
+        logged once the input is exhausted.
 
-        # Get filter mode and lists from config
-        filter_mode = self.config.get("channel_filter_mode", "none")
-        allowlist = self.config.get("channel_allowlist")
-        blocklist = self.config.get("channel_blocklist")
+        Args:
+            videos: Iterable of video data from YouTube API
+            channel_whitelist: Set of allowed channel IDs (None = allow all) - LEGACY parameter
 
-        # Use legacy whitelist if new system not configured
-        if filter_mode == "none" and channel_whitelist:
-            filter_mode = "allowlist"
-            allowlist = channel_whitelist
+        Yields:
+            Videos that should be added to playlist
+        """
+        self.stats = stats = self._init_stats()
+
+        ctx = self._build_context(channel_whitelist)
+        processed = self.cache.get_all_processed()
+
+        rejection_reason = _select_rejection_reason(ctx)
+
+        # Resolve log levels once per batch instead of per video
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        info_enabled = logger.isEnabledFor(logging.INFO)
 
         for video in videos:
-            if not self._should_include_video(video, filter_mode, allowlist, blocklist, min_duration, max_duration):
+            stats["total"] += 1
+
+            # Check if already processed (plain set lookup, no method dispatch)
+            if video["video_id"] in processed:
+                if debug_enabled:
+                    logger.debug("Skipping already processed: %s", video["title"])
+                stats["already_processed"] += 1
+                continue
+
+            reason = rejection_reason(video, ctx)
+            if reason is not None:
+                stats[reason] += 1
+                if info_enabled:
+                    _log_rejection(reason, video, debug_enabled)
                 continue
 
             # Video passed all filters
-            self.stats["passed_filters"] += 1
-            filtered.append(video)
+            stats["passed_filters"] += 1
 
-            title = video["title"]
-            duration = video["duration_seconds"]
-            channel_title = video["channel_title"]
-            logger.info(f"✓ {title} ({duration}s) by {channel_title}")
+            if info_enabled:
+                logger.info(
+                    "✓ %s (%ss) by %s",
+                    video["title"], video["duration_seconds"], video["channel_title"]
+                )
 
-        self._log_filtering_stats(filter_mode, allowlist, blocklist, min_duration, max_duration)
-        return filtered
-    
-    def _should_include_video(
-        self,
-        video: Dict[str, Any],
-        filter_mode: str,
-        allowlist: Optional[Set[str]],
-        blocklist: Optional[Set[str]],
-        min_duration: int,
-        max_duration: Optional[int] = None
-    ) -> bool:
+            yield video
+
+        self._log_filtering_stats(ctx)
+
+    def _build_context(self, channel_whitelist: Optional[Set[str]] = None) -> FilterContext:
         """
-        Check if a video should be included based on all filters.
+        Resolve all filter settings for one batch of videos.
 
         Args:
-            video: Video data dictionary
-            filter_mode: Channel filter mode ("none", "allowlist", "blocklist")
-            allowlist: Set of allowed channel IDs (for allowlist mode)
-            blocklist: Set of blocked channel IDs (for blocklist mode)
-            min_duration: Minimum duration in seconds
-            max_duration: Maximum duration in seconds (None = unlimited)
+            channel_whitelist: Set of allowed channel IDs (None = allow all) - LEGACY parameter
 
         Returns:
-            True if video passes all filters, False otherwise
+            FilterContext with config values and pre-normalized keywords
         """
-        video_id = video["video_id"]
-        title = video["title"]
-        channel_id = video["channel_id"]
-        channel_title = video["channel_title"]
-        duration = video["duration_seconds"]
-
-        # Check if already processed
-        if self.cache.is_processed(video_id):
-            logger.debug(f"Skipping already processed: {title}")
-            self.stats["already_processed"] += 1
-            return False
-
-        # Check duration filters
-        if duration < min_duration:
-            logger.debug(f"Skipping too short ({duration}s): {title}")
-            self.stats["too_short"] += 1
-            return False
-
-        if max_duration and duration > max_duration:
-            logger.debug(f"Skipping too long ({duration}s): {title}")
-            self.stats["too_long"] += 1
-            return False
-
-        # Check channel filtering
-        if filter_mode == "allowlist" and allowlist:
-            if channel_id not in allowlist:
-                logger.debug(f"Skipping channel not in allowlist {channel_title}: {title}")
-                self.stats["not_in_allowlist"] += 1
-                self.stats["not_whitelisted"] += 1  # Legacy stat
-                return False
-
-        elif filter_mode == "blocklist" and blocklist:
-            if channel_id in blocklist:
-                logger.debug(f"Skipping blocked channel {channel_title}: {title}")
-                self.stats["in_blocklist"] += 1
-                return False
-
-        # Check date filter
-        if not self._check_date_filter(video):
-            logger.debug(f"Skipping outside date range: {title}")
-            self.stats["outside_date_range"] += 1
-            return False
-
-        # Check keyword filter
-        keyword_result = self._check_keyword_filter(video)
-        if keyword_result == "filtered_include":
-            logger.debug(f"Skipping (not in include keywords): {title}")
-            self.stats["keyword_filtered_include"] += 1
-            return False
-        elif keyword_result == "filtered_exclude":
-            logger.debug(f"Skipping (matches exclude keywords): {title}")
-            self.stats["keyword_filtered_exclude"] += 1
-            return False
-
-        # Check live content filter
-        if self.config["skip_live_content"]:
-            live_broadcast = video.get("live_broadcast", "none")
-            if live_broadcast != "none":
-                live_type = "livestream" if live_broadcast == "live" else "premiere"
-                logger.info(f"Skipping {live_type}: {title}")
-                self.stats["live_content_skipped"] += 1
-                return False
+        config = self.config
 
-        return True
+        filter_mode = config.get("channel_filter_mode", "none")
+        allowlist = self._allowlist
 
-    def _check_date_filter(self, video: Dict[str, Any]) -> bool:
+        # Use legacy whitelist if new system not configured
+        if filter_mode == "none" and channel_whitelist:
+            filter_mode = "allowlist"
+            allowlist = _intern_channel_ids(channel_whitelist)
+
+        date_start, date_end = self._date_bounds()
+
+        # Cutoff as an ISO string rounded up to the second, for comparing
+        # against raw publishedAt strings without parsing them
+        if date_start.microsecond:
+            date_start_str = (date_start.replace(microsecond=0) + timedelta(seconds=1)).isoformat()
+        else:
+            date_start_str = date_start.isoformat()
+
+        # Skip the date and keyword checks entirely when they can't reject
+        keyword_mode = config.get("keyword_filter_mode", "none")
+        keyword_filter_active = (
+            (keyword_mode in ("include", "both") and bool(self._include_keywords))
+            or (keyword_mode in ("exclude", "both") and bool(self._exclude_keywords))
+        )
+
+        return FilterContext(
+            min_duration=config["min_duration_seconds"],
+            max_duration=config.get("max_duration_seconds"),
+            filter_mode=filter_mode,
+            allowlist=allowlist,
+            blocklist=self._blocklist,
+            skip_live=self._skip_live,
+            date_mode=config.get("date_filter_mode", "lookback"),
+            date_start=date_start,
+            date_end=date_end,
+            date_start_str=date_start_str,
+            date_filter_active=(date_start != datetime.min or date_end != datetime.max),
+            keyword_mode=keyword_mode,
+            keyword_case_sensitive=self._keyword_case_sensitive,
+            keyword_search_description=config.get("keyword_search_description", False),
+            keyword_match_type=config.get("keyword_match_type", "any"),
+            include_keywords=self._include_keywords,
+            include_any=self._include_any,
+            exclude_any=self._exclude_any,
+            keyword_filter_active=keyword_filter_active,
+        )
+
+    def _date_bounds(self) -> Tuple[datetime, datetime]:
         """
-        Check if video passes date filter criteria.
+        Compute the published-at window for the configured date filter mode.
 
-        Args:
-            video: Video data dictionary with published_at field
+        Evaluated once per batch so every video is checked against the same
+        cutoffs without recomputing ``utcnow()`` and timedeltas per video.
 
         Returns:
-            True if video passes date filter, False otherwise
+            (start, end) naive UTC datetimes; open-ended sides use
+            ``datetime.min`` / ``datetime.max``
         """
         date_mode = self.config.get("date_filter_mode", "lookback")
-
-        # Get video published date (assumed to be in ISO format from YouTube API)
-        published_at_str = video.get("published_at")
-        if not published_at_str:
-            # If no published date, allow video through (shouldn't happen with YouTube API)
-            return True
-
-        # Parse published date
-        try:
-            # Handle both RFC 3339 format (with Z) and ISO format
-            if published_at_str.endswith('Z'):
-                published_at = datetime.strptime(published_at_str, '%Y-%m-%dT%H:%M:%SZ')
-            else:
-                published_at = datetime.fromisoformat(published_at_str.replace('Z', '+00:00'))
-        except ValueError:
-            logger.warning(f"Could not parse published_at date: {published_at_str}")
-            return True
-
         now = datetime.utcnow()
 
         if date_mode == "lookback":
             # Use lookback_hours (default behavior)
             lookback_hours = self.config.get("lookback_hours", 24)
-            cutoff = now - timedelta(hours=lookback_hours)
-            return published_at >= cutoff
+            return now - timedelta(hours=lookback_hours), datetime.max
 
         elif date_mode == "days":
             # Use date_filter_days (last N days)
@@ -273,7 +646,7 @@ class VideoFilter:
             cutoff = now - timedelta(days=days)
             # Set cutoff to start of day
             cutoff = cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
-            return published_at >= cutoff
+            return cutoff, datetime.max
 
         elif date_mode == "date_range":
             # Use date_filter_start and date_filter_end
@@ -282,128 +655,55 @@ class VideoFilter:
 
             if not start_str or not end_str:
                 # Missing date range, allow through (shouldn't happen with validation)
-                return True
+                return datetime.min, datetime.max
 
             try:
                 start_date = datetime.strptime(start_str, "%Y-%m-%d")
                 end_date = datetime.strptime(end_str, "%Y-%m-%d")
                 # Set end_date to end of day (23:59:59)
                 end_date = end_date.replace(hour=23, minute=59, second=59)
-
-                return start_date <= published_at <= end_date
+                return start_date, end_date
             except ValueError:
-                logger.warning(f"Could not parse date range: {start_str} to {end_str}")
-                return True
+                logger.warning("Could not parse date range: %s to %s", start_str, end_str)
+                return datetime.min, datetime.max
 
         # Unknown mode, allow through
-        return True
-
-    def _check_keyword_filter(self, video: Dict[str, Any]) -> Optional[str]:
-        """
-        Check if video passes keyword filter criteria.
-
-        Args:
-            video: Video data dictionary with title and description fields
+        return datetime.min, datetime.max
 
-        Returns:
-            None if passes filter
-            "filtered_include" if doesn't match include keywords
-            "filtered_exclude" if matches exclude keywords
-        """
-        mode = self.config.get("keyword_filter_mode", "none")
-
-        if mode == "none":
-            return None
-
-        # Get search fields
-        title = video.get("title", "")
-        description = video.get("description", "")
-        search_description = self.config.get("keyword_search_description", False)
-
-        # Build search text
-        search_text = title
-        if search_description and description:
-            search_text = f"{title} {description}"
-
-        # Handle case sensitivity
-        case_sensitive = self.config.get("keyword_case_sensitive", False)
-        if not case_sensitive:
-            search_text = search_text.lower()
-
-        # Get keyword lists
-        include_list = self.config.get("keyword_include", [])
-        exclude_list = self.config.get("keyword_exclude", [])
-        match_type = self.config.get("keyword_match_type", "any")
-
-        # Check include filter
-        if mode in ["include", "both"]:
-            if not include_list:
-                # No include list, pass through
-                pass
-            else:
-                # Check if any/all keywords match
-                keywords_to_check = [k if case_sensitive else k.lower() for k in include_list]
-
-                if match_type == "any":
-                    # At least one keyword must match
-                    if not any(keyword in search_text for keyword in keywords_to_check):
-                        return "filtered_include"
-                else:  # match_type == "all"
-                    # All keywords must match
-                    if not all(keyword in search_text for keyword in keywords_to_check):
-                        return "filtered_include"
-
-        # Check exclude filter
-        if mode in ["exclude", "both"]:
-            if exclude_list:
-                keywords_to_check = [k if case_sensitive else k.lower() for k in exclude_list]
-
-                # If any exclude keyword matches, filter out
-                if any(keyword in search_text for keyword in keywords_to_check):
-                    return "filtered_exclude"
-
-        return None
-
-    def _log_filtering_stats(
-        self,
-        filter_mode: str,
-        allowlist: Optional[Set[str]],
-        blocklist: Optional[Set[str]],
-        min_duration: int,
-        max_duration: Optional[int] = None
-    ) -> None:
+    def _log_filtering_stats(self, ctx: FilterContext) -> None:
         """Log comprehensive filtering statistics."""
-        logger.info(f"Video filtering stats:")
-        logger.info(f"  Total videos: {self.stats['total']}")
-        logger.info(f"  Already processed: {self.stats['already_processed']}")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        stats = self.stats
+        logger.info("Video filtering stats:")
+        logger.info("  Total videos: %d", stats['total'])
+        logger.info("  Already processed: %d", stats['already_processed'])
 
         # Duration filtering stats
-        if max_duration:
-            logger.info(f"  Too short (<{min_duration}s): {self.stats['too_short']}")
-            logger.info(f"  Too long (>{max_duration}s): {self.stats['too_long']}")
-        else:
-            logger.info(f"  Too short (<{min_duration}s): {self.stats['too_short']}")
+        logger.info("  Too short (<%ss): %d", ctx.min_duration, stats['too_short'])
+        if ctx.max_duration:
+            logger.info("  Too long (>%ss): %d", ctx.max_duration, stats['too_long'])
 
         # Date filtering stats
-        if self.stats['outside_date_range'] > 0:
-            date_mode = self.config.get("date_filter_mode", "lookback")
-            logger.info(f"  Outside date range ({date_mode} mode): {self.stats['outside_date_range']}")
+        if stats['outside_date_range'] > 0:
+            logger.info("  Outside date range (%s mode): %d", ctx.date_mode, stats['outside_date_range'])
 
         # Keyword filtering stats
-        if self.stats['keyword_filtered_include'] > 0:
-            logger.info(f"  Keyword filtered (include): {self.stats['keyword_filtered_include']}")
-        if self.stats['keyword_filtered_exclude'] > 0:
-            logger.info(f"  Keyword filtered (exclude): {self.stats['keyword_filtered_exclude']}")
+        if stats['keyword_filtered_include'] > 0:
+            logger.info("  Keyword filtered (include): %d", stats['keyword_filtered_include'])
+        if stats['keyword_filtered_exclude'] > 0:
+            logger.info("  Keyword filtered (exclude): %d", stats['keyword_filtered_exclude'])
 
-        if filter_mode == "allowlist" and allowlist:
-            logger.info(f"  Not in allowlist: {self.stats['not_in_allowlist']}")
-        elif filter_mode == "blocklist" and blocklist:
-            logger.info(f"  Blocked channels: {self.stats['in_blocklist']}")
+        if ctx.filter_mode == "allowlist" and ctx.allowlist:
+            logger.info("  Not in allowlist: %d", stats['not_in_allowlist'])
+        elif ctx.filter_mode == "blocklist" and ctx.blocklist:
+            logger.info("  Blocked channels: %d", stats['in_blocklist'])
 
-        if self.config["skip_live_content"]:
-            logger.info(f"  Live content skipped: {self.stats['live_content_skipped']}")
+        if ctx.skip_live:
+            logger.info("  Live content skipped: %d", stats['live_content_skipped'])
 
-        logger.info(f"  Passed filters: {self.stats['passed_filters']}")
+        logger.info("  Passed filters: %d", stats['passed_filters'])
     
     def get_filtering_stats(self) -> Dict[str, int]:
         """
@@ -412,7 +712,9 @@ class VideoFilter:
         Returns:
             Dictionary of filtering statistics
         """
-        return self.stats.copy()
+        stats = self.stats.copy()
+        stats["not_whitelisted"] = stats["not_in_allowlist"]  # Legacy stat
+        return stats
 
 
 # Legacy function for backward compatibility
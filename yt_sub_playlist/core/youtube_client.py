@@ -13,18 +13,53 @@ with features specifically designed for playlist automation:
 import json
 import logging
 import os
+import random
+import re
+import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
-from ..auth.oauth import get_authenticated_service
+try:
+    import orjson
+except ImportError:  # Optional speedup: `uv sync --extra fast`
+    orjson = None
+
+from ..auth.oauth import get_authenticated_service, get_credentials
 
 logger = logging.getLogger(__name__)
 
+# Concurrent subscription-page fetches when scanning subscriptions; the work
+# is almost entirely waiting on HTTP round trips
+CHANNEL_FETCH_WORKERS = 8
+
+# httplib2 cache entries not written for this long are deleted at startup.
+# Revalidated entries are rewritten on every 304, so only responses that are
+# no longer requested (old videos.list ID sets, unsubscribed channels) age out
+HTTP_CACHE_MAX_AGE_DAYS = 3
+
+# ISO 8601 video duration as returned by videos.list (e.g. "PT1H2M30S")
+_DURATION_RE = re.compile(r'^PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?$')
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Length of a second-precision UTC RFC 3339 timestamp ("2024-01-15T00:00:00Z")
+_RFC3339_UTC_LEN = 20
+
 # Global API call counter for quota tracking
 api_call_counter: Dict[str, int] = {}
+_api_call_counter_lock = threading.Lock()
 
 
 def track_api_call(method_name: str) -> None:
@@ -35,8 +70,33 @@ def track_api_call(method_name: str) -> None:
         method_name: The YouTube API method name (e.g., "playlistItems.list")
     """
     global api_call_counter
-    api_call_counter[method_name] = api_call_counter.get(method_name, 0) + 1
-    logger.debug(f"API call tracked: {method_name} (count: {api_call_counter[method_name]})")
+    with _api_call_counter_lock:
+        count = api_call_counter[method_name] = api_call_counter.get(method_name, 0) + 1
+    logger.debug(f"API call tracked: {method_name} (count: {count})")
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given 0-based retry attempt, capped at 2s."""
+    return min(2 ** attempt * 0.1 + random.uniform(0, 0.1), 2.0)
+
+
+def _is_published_after(published_at: str, cutoff: str) -> bool:
+    """
+    Check whether an RFC 3339 timestamp is strictly later than the cutoff.
+
+    Second-precision UTC timestamps, the form YouTube returns and
+    get_published_after_timestamp() produces, are compared as strings since
+    their lexical order is chronological. Anything else is parsed.
+    """
+    if (
+        len(published_at) == len(cutoff) == _RFC3339_UTC_LEN
+        and published_at[-1] == cutoff[-1] == 'Z'
+    ):
+        return published_at > cutoff
+    return (
+        datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+        > datetime.fromisoformat(cutoff.replace('Z', '+00:00'))
+    )
 
 
 def dump_api_call_log(path: Path) -> None:
@@ -53,8 +113,11 @@ def dump_api_call_log(path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         
         # Write the counter to JSON file
-        with open(path, 'w') as f:
-            json.dump(api_call_counter, f, indent=2)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(api_call_counter, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w') as f:
+                json.dump(api_call_counter, f, indent=2)
         
         total_calls = sum(api_call_counter.values())
         logger.info(f"API call log dumped to {path} ({total_calls} total calls tracked)")
@@ -63,9 +126,12 @@ def dump_api_call_log(path: Path) -> None:
         logger.error(f"Failed to dump API call log to {path}: {e}")
 
 
+@lru_cache(maxsize=4096)
 def parse_duration_to_seconds(duration: str) -> int:
     """
     Parse ISO 8601 duration format (PT4M13S) to seconds.
+
+    Memoized: durations repeat a lot across videos (shorts, P0D for live).
     
     Args:
         duration: ISO 8601 duration string (e.g., "PT4M13S", "PT1H2M30S")
@@ -73,34 +139,16 @@ def parse_duration_to_seconds(duration: str) -> int:
     Returns:
         Total duration in seconds
     """
-    import re
-    
-    if not duration or not duration.startswith('PT'):
+    match = _DURATION_RE.match(duration) if duration else None
+    if not match:
         return 0
-    
-    # Remove PT prefix and extract time components
-    time_part = duration[2:]
-    
-    # Initialize components
-    hours = minutes = seconds = 0
-    
-    # Extract hours
-    hours_match = re.search(r'(\d+)H', time_part)
-    if hours_match:
-        hours = int(hours_match.group(1))
-    
-    # Extract minutes
-    minutes_match = re.search(r'(\d+)M', time_part)
-    if minutes_match:
-        minutes = int(minutes_match.group(1))
-    
-    # Extract seconds
-    seconds_match = re.search(r'(\d+)S', time_part)
-    if seconds_match:
-        seconds = int(seconds_match.group(1))
-    
-    total_seconds = hours * 3600 + minutes * 60 + seconds
-    return total_seconds
+
+    hours, minutes, seconds = match.groups()
+    return (
+        (int(hours) if hours else 0) * 3600
+        + (int(minutes) if minutes else 0) * 60
+        + (int(seconds) if seconds else 0)
+    )
 
 
 class YouTubeClient:
@@ -121,19 +169,79 @@ class YouTubeClient:
         Args:
             data_dir: Directory for storing cache files and data
         """
-        self.service = get_authenticated_service()
+        self.credentials = get_credentials()
+        self.service = get_authenticated_service(self.credentials)
         self.quota_exceeded = False
+        self._thread_local = threading.local()
         self.data_dir = data_dir
         
         # Ensure data directory exists
         os.makedirs(data_dir, exist_ok=True)
         os.makedirs(os.path.join(data_dir, "playlist_cache"), exist_ok=True)
 
+        # A channel's uploads playlist never changes, so these are kept forever
+        self._uploads_cache_file = os.path.join(
+            data_dir, "playlist_cache", "uploads_playlist_ids.json"
+        )
+        self._uploads_playlist_cache = self._load_uploads_playlist_cache()
+
+        # httplib2 response cache; lets repeated GETs revalidate by ETag
+        self._http_cache_dir = os.path.join(data_dir, "http_cache")
+        self._prune_http_cache()
+
+        # Per-run memo of API results that can be asked for more than once
+        self._existing_items_mem: Dict[str, Set[str]] = {}
+        self._video_details_mem: Dict[str, Dict[str, Any]] = {}
+
+    def _thread_http(self) -> AuthorizedHttp:
+        """
+        Return an authorized HTTP object owned by the calling thread.
+
+        httplib2 connections are not thread-safe, so requests pass this to
+        ``execute(http=...)`` instead of sharing the service's own connection.
+        It is built like the service's own transport (``build_http``), so it
+        keeps the client library's socket timeout and 308 handling; a
+        stalled connection fails instead of blocking its thread forever.
+
+        Responses are stored in an on-disk cache keyed by URL. httplib2 then
+        sends repeated GETs with ``If-None-Match`` and serves the stored body
+        when YouTube answers 304 Not Modified.
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            transport = build_http()
+            transport.cache = httplib2.FileCache(self._http_cache_dir)
+            http = AuthorizedHttp(self.credentials, http=transport)
+            self._thread_local.http = http
+        return http
+
+    def _prune_http_cache(self) -> None:
+        """Delete HTTP cache entries that haven't been used recently."""
+        cutoff = time.time() - HTTP_CACHE_MAX_AGE_DAYS * 86400
+        try:
+            entries = list(os.scandir(self._http_cache_dir))
+        except OSError:
+            return  # No cache yet
+        removed = 0
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError as e:
+                logger.debug(f"Could not prune HTTP cache entry {entry.name}: {e}")
+        if removed:
+            logger.debug(f"Pruned {removed} stale HTTP cache entries")
+
     def fetch_existing_playlist_items(self, playlist_id: str) -> Set[str]:
         """
         Fetch all existing video IDs from a playlist with disk-based caching.
         
-        Uses disk cache with 12-hour TTL to avoid repeated API calls.
+        The disk cache is validated against the playlist's etag and item
+        count (one playlists.list call) instead of trusting it for a fixed
+        time, so a changed playlist is refetched right away and an unchanged
+        one is never paged through again. If that check fails, the cache
+        falls back to a 12-hour TTL.
         Supports pagination for playlists with >50 videos.
         
         Args:
@@ -142,22 +250,30 @@ class YouTubeClient:
         Returns:
             Set of video IDs currently in the playlist
         """
-        cache_file = os.path.join(
-            self.data_dir, "playlist_cache", f"existing_playlist_items_{playlist_id}.json"
-        )
+        # Already fetched during this run (and kept current by inserts)
+        if playlist_id in self._existing_items_mem:
+            return self._existing_items_mem[playlist_id]
+
+        cache_file, meta_file = self._playlist_cache_files(playlist_id)
         cache_ttl_hours = 12
+        signature = self._get_playlist_signature(playlist_id)
         
         # Check if cache exists and is still valid
         if os.path.exists(cache_file):
             try:
                 cache_age = time.time() - os.path.getmtime(cache_file)
-                if cache_age < cache_ttl_hours * 3600:  # Convert hours to seconds
+                if signature is not None:
+                    cache_valid = self._load_playlist_cache_signature(meta_file) == signature
+                else:
+                    cache_valid = cache_age < cache_ttl_hours * 3600  # Convert hours to seconds
+                if cache_valid:
+                    # One video ID per line; fixed-width IDs need no parser
                     with open(cache_file, 'r', encoding='utf-8') as f:
-                        cached_data = json.load(f)
-                        video_ids = set(cached_data.get('video_ids', []))
-                        logger.info(f"Using cached playlist items ({len(video_ids)} videos, {cache_age/3600:.1f}h old)")
-                        return video_ids
-            except (json.JSONDecodeError, OSError) as e:
+                        video_ids = set(f.read().splitlines())
+                    logger.info(f"Using cached playlist items ({len(video_ids)} videos, {cache_age/3600:.1f}h old)")
+                    self._existing_items_mem[playlist_id] = video_ids
+                    return video_ids
+            except (OSError, ValueError) as e:
                 logger.warning(f"Failed to read playlist cache: {e}")
                 # Continue to fresh fetch
         
@@ -174,10 +290,11 @@ class YouTubeClient:
                     part='contentDetails',
                     playlistId=playlist_id,
                     maxResults=50,
-                    pageToken=next_page_token
+                    pageToken=next_page_token,
+                    fields='nextPageToken,items/contentDetails/videoId'
                 )
                 
-                response = request.execute()
+                response = request.execute(http=self._thread_http())
                 track_api_call("playlistItems.list")
                 
                 # Extract video IDs from this page
@@ -200,18 +317,8 @@ class YouTubeClient:
             logger.info(f"Fetched {len(video_ids)} existing videos from playlist ({page_count} API pages)")
             
             # Cache the results
-            try:
-                cache_data = {
-                    'video_ids': list(video_ids),
-                    'fetched_at': time.time(),
-                    'playlist_id': playlist_id
-                }
-                with open(cache_file, 'w', encoding='utf-8') as f:
-                    json.dump(cache_data, f, indent=2)
-                logger.debug(f"Cached playlist items to {cache_file}")
-            except OSError as e:
-                logger.warning(f"Failed to cache playlist items: {e}")
-                
+            self._save_playlist_cache(playlist_id, video_ids, signature)
+
         except HttpError as e:
             if e.resp.status == 403 and "quotaExceeded" in str(e):
                 self.quota_exceeded = True
@@ -223,8 +330,96 @@ class YouTubeClient:
             logger.error(f"Unexpected error fetching playlist items: {e}")
             return set()
         
+        self._existing_items_mem[playlist_id] = video_ids
         return video_ids
 
+    def _playlist_cache_files(self, playlist_id: str) -> Tuple[str, str]:
+        """Return the (video IDs, signature) cache file paths for a playlist."""
+        cache_dir = os.path.join(self.data_dir, "playlist_cache")
+        return (
+            os.path.join(cache_dir, f"existing_playlist_items_{playlist_id}.txt"),
+            os.path.join(cache_dir, f"existing_playlist_items_{playlist_id}.meta.json"),
+        )
+
+    def _save_playlist_cache(
+        self, playlist_id: str, video_ids: Set[str], signature: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Write a playlist's video IDs and the signature they match to disk.
+
+        Without a signature the cache is only trusted until its TTL runs out.
+        """
+        cache_file, meta_file = self._playlist_cache_files(playlist_id)
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                f.write("\n".join(video_ids))
+            with open(meta_file, 'w', encoding='utf-8') as f:
+                json.dump({**(signature or {}), 'fetched_at': time.time()}, f)
+            logger.debug(f"Cached playlist items to {cache_file}")
+        except OSError as e:
+            logger.warning(f"Failed to cache playlist items: {e}")
+
+    def _refresh_playlist_cache(self, playlist_id: str) -> None:
+        """
+        Re-save a playlist's cache after this run inserted into it.
+
+        Our own inserts change the playlist's etag and item count, so the
+        stored signature would otherwise send the next run back through a
+        full refetch. The per-run memo already holds every inserted video,
+        so one playlists.list call for the new signature keeps the cache
+        valid.
+        """
+        video_ids = self._existing_items_mem.get(playlist_id)
+        if video_ids is None:
+            return  # The playlist was never fully fetched; nothing to refresh
+        signature = None if self.quota_exceeded else self._get_playlist_signature(playlist_id)
+        self._save_playlist_cache(playlist_id, video_ids, signature)
+
+    def _get_playlist_signature(self, playlist_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a cheap change signature for a playlist (1 quota unit).
+
+        Args:
+            playlist_id: Playlist to check
+
+        Returns:
+            Dict with the playlist's etag and item_count, or None if the
+            playlist couldn't be checked
+        """
+        try:
+            request = self.service.playlists().list(
+                part="contentDetails",
+                id=playlist_id,
+                fields="items(etag,contentDetails/itemCount)"
+            )
+            response = request.execute(http=self._thread_http())
+            track_api_call("playlists.list")
+        except HttpError as e:
+            if e.resp.status == 403 and "quotaExceeded" in str(e):
+                self.quota_exceeded = True
+            logger.warning(f"Could not check playlist {playlist_id} for changes: {e}")
+            return None
+        except Exception as e:
+            logger.warning(f"Unexpected error checking playlist {playlist_id} for changes: {e}")
+            return None
+
+        items = response.get("items", [])
+        if not items:
+            return None
+        return {
+            "etag": items[0].get("etag"),
+            "item_count": items[0].get("contentDetails", {}).get("itemCount"),
+        }
+
+    def _load_playlist_cache_signature(self, meta_file: str) -> Optional[Dict[str, Any]]:
+        """Read the etag/item_count stored alongside a playlist items cache."""
+        try:
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return {"etag": meta.get("etag"), "item_count": meta.get("item_count")}
+
     def get_subscription_activity(
         self, published_after: str, max_results: int = 50
     ) -> List[Dict[str, Any]]:
@@ -246,10 +441,11 @@ class YouTubeClient:
                 part="snippet,contentDetails",
                 mine=True,
                 publishedAfter=published_after,
-                maxResults=max_results
+                maxResults=max_results,
+                fields="items(snippet(type,title,channelId,channelTitle,publishedAt),contentDetails/upload/videoId)"
             )
             
-            response = request.execute()
+            response = request.execute(http=self._thread_http())
             track_api_call("activities.list")
             activity_map = {}
             video_ids = []
@@ -270,15 +466,16 @@ class YouTubeClient:
 
             # Combine activity data with video details
             for video_id, details in videos_details.items():
-                if video_id in activity_map:
-                    activity = activity_map[video_id]
+                activity = activity_map.get(video_id)
+                if activity is not None:
+                    snippet = activity["snippet"]
 
                     video_data = {
                         "video_id": video_id,
-                        "title": activity["snippet"]["title"],
-                        "channel_id": activity["snippet"]["channelId"],
-                        "channel_title": activity["snippet"]["channelTitle"],
-                        "published_at": activity["snippet"]["publishedAt"],
+                        "title": snippet["title"],
+                        "channel_id": snippet["channelId"],
+                        "channel_title": snippet["channelTitle"],
+                        "published_at": snippet["publishedAt"],
                         "duration_seconds": parse_duration_to_seconds(details["duration"]),
                         "live_broadcast": details["liveBroadcastContent"]
                     }
@@ -302,52 +499,57 @@ class YouTubeClient:
         self, published_after: str, max_per_channel: int = 5
     ) -> List[Dict[str, Any]]:
         """
-        Get recent uploads from all subscribed channels using optimized uploads playlist lookup.
+        Get recent uploads from all subscribed channels as a list.
+
+        Convenience wrapper around ``iter_recent_uploads_from_subscriptions``
+        for callers that need the full result set at once.
+
+        Args:
+            published_after: RFC 3339 timestamp for filtering recent videos
+            max_per_channel: Maximum videos to fetch per channel
+
+        Returns:
+            List of video data dictionaries
+        """
+        return list(self.iter_recent_uploads_from_subscriptions(published_after, max_per_channel))
+
+    def iter_recent_uploads_from_subscriptions(
+        self, published_after: str, max_per_channel: int = 5
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield recent uploads from all subscribed channels using optimized uploads playlist lookup.
         
         This method is quota-optimized (~98% reduction vs search API) by:
         1. Fetching subscriptions list (1 unit)
-        2. Getting channel uploads playlist IDs (1 unit per ~50 channels)
+        2. Deriving channel uploads playlist IDs (no API call for standard "UC" channel IDs)
         3. Fetching recent videos from uploads playlists (1 unit per ~50 videos)
         4. Batch fetching video details (1 unit per ~50 videos)
 
+        Each page of subscriptions is handed to a small thread pool as soon
+        as it arrives, and its channels' uploads playlists are fetched in one
+        batched HTTP request. Video details are looked up for all channels
+        together, 50 distinct videos per call, and videos are yielded channel
+        by channel in subscription order as soon as their details are in, so
+        downstream filtering can run while later channels are still being
+        fetched.
+
         Args:
             published_after: RFC 3339 timestamp for filtering recent videos  
             max_per_channel: Maximum videos to fetch per channel
 
-        Returns:
-            List of video data dictionaries
+        Yields:
+            Video data dictionaries
         """
-        videos = []
+        total_videos = 0
 
         try:
-            # Step 1: Get all subscribed channels
-            subscriptions = self._get_all_subscriptions()
-            
-            if not subscriptions:
-                logger.info("No subscriptions found")
-                return videos
+            for video in self._attach_video_details(
+                self._iter_recent_channel_items(published_after, max_per_channel)
+            ):
+                total_videos += 1
+                yield video
 
-            logger.info(f"Processing {len(subscriptions)} subscribed channels")
-
-            # Step 2: Process each channel's uploads playlist
-            for subscription in subscriptions:
-                channel_id = subscription["snippet"]["resourceId"]["channelId"]
-                channel_title = subscription["snippet"]["title"]
-                
-                # Get the uploads playlist ID for this channel
-                uploads_playlist_id = self._get_uploads_playlist_id(channel_id, channel_title)
-                if not uploads_playlist_id:
-                    continue
-
-                # Get recent videos from the uploads playlist
-                channel_videos = self._get_recent_videos_from_uploads_playlist(
-                    uploads_playlist_id, channel_title, max_per_channel, published_after
-                )
-                
-                videos.extend(channel_videos)
-
-            logger.info(f"Found {len(videos)} total recent videos from subscriptions")
-            return videos
+            logger.info(f"Found {total_videos} total recent videos from subscriptions")
 
         except HttpError as e:
             if e.resp.status == 403 and "quotaExceeded" in str(e):
@@ -355,14 +557,189 @@ class YouTubeClient:
                 logger.error("YouTube API quota exceeded while fetching subscription uploads.")
             else:
                 logger.error(f"YouTube API error fetching subscription uploads: {e}")
-            return []
         except Exception as e:
             logger.error(f"Unexpected error fetching subscription uploads: {e}")
-            return []
 
-    def _get_all_subscriptions(self) -> List[Dict[str, Any]]:
-        """Get all user subscriptions with pagination support."""
-        subscriptions = []
+    def _iter_recent_channel_items(
+        self, published_after: str, max_per_channel: int
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Yield (channel title, recent uploads playlist items) for every
+        subscribed channel, in subscription order.
+        """
+        subscription_count = 0
+        executor = ThreadPoolExecutor(max_workers=CHANNEL_FETCH_WORKERS)
+        pending = deque()
+        try:
+            # Step 1: Page through subscribed channels. Each page is
+            # handed to the workers before the next one is requested, so
+            # channel fetches overlap with the remaining pagination.
+            for subscriptions in self._iter_subscription_pages():
+                subscription_count += len(subscriptions)
+
+                # Step 2: Look up this page's uploads playlist IDs (derived from channel IDs where possible)
+                uploads_playlist_ids = self._get_uploads_playlist_ids([
+                    subscription["snippet"]["resourceId"]["channelId"]
+                    for subscription in subscriptions
+                ])
+
+                # Step 3: Fetch the page's recent uploads playlist items
+                pending.append(executor.submit(
+                    self._fetch_page_uploads,
+                    subscriptions, uploads_playlist_ids, max_per_channel, published_after
+                ))
+
+                # Pass on pages that already finished, keeping subscription order
+                while pending and pending[0].done():
+                    yield from pending.popleft().result()
+
+            if not subscription_count:
+                logger.info("No subscriptions found")
+                return
+
+            logger.info(f"Processing {subscription_count} subscribed channels")
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Don't spend quota on channels nobody will consume
+            executor.shutdown(cancel_futures=True)
+
+    def _fetch_page_uploads(
+        self,
+        subscriptions: List[Dict[str, Any]],
+        uploads_playlist_ids: Dict[str, str],
+        max_per_channel: int,
+        published_after: str
+    ) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Fetch recent uploads for one page of subscribed channels (runs on a worker thread).
+
+        Returns:
+            (channel title, recent playlist items) per subscription, in order
+        """
+        channels = []
+        for subscription in subscriptions:
+            channel_title = subscription["snippet"]["title"]
+            uploads_playlist_id = uploads_playlist_ids.get(
+                subscription["snippet"]["resourceId"]["channelId"]
+            )
+            if not uploads_playlist_id:
+                logger.debug(f"No channel data found for {channel_title}")
+            channels.append((channel_title, uploads_playlist_id))
+
+        to_fetch = [channel for channel in channels if channel[1]]
+        if self.quota_exceeded or not to_fetch:
+            return [(channel_title, []) for channel_title, _ in channels]
+
+        items_by_playlist = dict(zip(
+            [uploads_playlist_id for _, uploads_playlist_id in to_fetch],
+            self._get_playlist_items_batch(to_fetch, max_per_channel)
+        ))
+
+        return [
+            (
+                channel_title,
+                self._filter_recent_items(
+                    items_by_playlist.get(uploads_playlist_id, []), channel_title, published_after
+                )
+            )
+            for channel_title, uploads_playlist_id in channels
+        ]
+
+    def _attach_video_details(
+        self, channel_items: Iterator[Tuple[str, List[Dict[str, Any]]]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Look up video details for channels' recent uploads and yield video records.
+
+        Video IDs are pooled and deduplicated across channels and fetched in
+        full batches of 50, so the details cost one videos.list call per 50
+        distinct recent uploads rather than one call per channel. A channel's
+        videos are yielded, in channel order, once all of them are looked up.
+
+        Args:
+            channel_items: (channel title, recent playlist items) pairs
+
+        Yields:
+            Video data dictionaries
+        """
+        batch_size = 50
+        waiting = deque()  # channels whose videos haven't been yielded yet
+        pending_ids = {}  # video IDs not looked up yet, in first-seen order
+        looked_up = set()
+
+        for channel_title, items in channel_items:
+            waiting.append((channel_title, items))
+            for item in items:
+                video_id = item["contentDetails"]["videoId"]
+                if video_id not in looked_up and video_id not in self._video_details_mem:
+                    pending_ids[video_id] = None
+
+            if len(pending_ids) < batch_size:
+                continue
+
+            # Fetch only full batches; the remainder waits for more channels
+            video_ids = list(pending_ids)
+            split = len(video_ids) - len(video_ids) % batch_size
+            self._get_videos_details(video_ids[:split])
+            looked_up.update(video_ids[:split])
+            pending_ids = dict.fromkeys(video_ids[split:])
+
+            while waiting and not any(
+                item["contentDetails"]["videoId"] in pending_ids for item in waiting[0][1]
+            ):
+                yield from self._build_upload_videos(*waiting.popleft())
+
+        if pending_ids:
+            self._get_videos_details(list(pending_ids))
+        while waiting:
+            yield from self._build_upload_videos(*waiting.popleft())
+
+    def _build_upload_videos(
+        self, channel_title: str, playlist_items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Combine a channel's playlist items with the video details fetched this run."""
+        video_details = self._video_details_mem
+        videos = []
+
+        for item in playlist_items:
+            video_id = item["contentDetails"]["videoId"]
+
+            # Get video details if available
+            details = video_details.get(video_id)
+            if details is None:
+                logger.debug(f"No details found for video {video_id}")
+                continue
+
+            snippet = item["snippet"]
+
+            video_data = {
+                "video_id": video_id,
+                "title": snippet["title"],
+                # Interned so channel allow/blocklist lookups match by identity
+                "channel_id": sys.intern(snippet["channelId"]),
+                "channel_title": channel_title,
+                "published_at": snippet["publishedAt"],
+                "duration_seconds": parse_duration_to_seconds(details["duration"]),
+                "live_broadcast": details["liveBroadcastContent"]
+            }
+            videos.append(video_data)
+
+        if videos:
+            logger.debug(f"Found {len(videos)} recent videos from {channel_title}")
+
+        return videos
+
+    def _iter_subscription_pages(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the user's subscriptions one API page (up to 50) at a time.
+
+        Page tokens make the listing inherently sequential; yielding each
+        page as it arrives lets the caller start work on it while the next
+        page is being fetched.
+        """
+        subscription_count = 0
         next_page_token = None
         
         try:
@@ -371,24 +748,27 @@ class YouTubeClient:
                     part="snippet",
                     mine=True,
                     maxResults=50,
-                    pageToken=next_page_token
+                    pageToken=next_page_token,
+                    fields="nextPageToken,items/snippet(title,resourceId/channelId)"
                 )
                 
-                response = request.execute()
+                response = request.execute(http=self._thread_http())
                 track_api_call("subscriptions.list")
-                subscriptions.extend(response.get("items", []))
+                page = response.get("items", [])
+                subscription_count += len(page)
+                if page:
+                    yield page
                 
                 next_page_token = response.get("nextPageToken")
                 if not next_page_token:
                     break
                     
                 # Safety check
-                if len(subscriptions) > 1000:
+                if subscription_count > 1000:
                     logger.warning("Reached subscription limit of 1000")
                     break
             
-            logger.debug(f"Retrieved {len(subscriptions)} subscriptions")
-            return subscriptions
+            logger.debug(f"Retrieved {subscription_count} subscriptions")
             
         except HttpError as e:
             if e.resp.status == 403 and "quotaExceeded" in str(e):
@@ -396,123 +776,210 @@ class YouTubeClient:
                 logger.error("YouTube API quota exceeded while fetching subscriptions.")
             else:
                 logger.error(f"YouTube API error fetching subscriptions: {e}")
-            return []
 
-    def _get_uploads_playlist_id(self, channel_id: str, channel_title: str) -> Optional[str]:
-        """Get the uploads playlist ID for a specific channel."""
+    def _load_uploads_playlist_cache(self) -> Dict[str, str]:
+        """Load the persistent channel_id -> uploads playlist ID cache."""
+        if not os.path.exists(self._uploads_cache_file):
+            return {}
+
         try:
-            request = self.service.channels().list(
-                part="contentDetails",
-                id=channel_id
-            )
-            
-            response = request.execute()
-            track_api_call("channels.list")
-            items = response.get("items", [])
-            
-            if not items:
-                logger.debug(f"No channel data found for {channel_title}")
-                return None
-                
-            uploads_playlist_id = items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
-            logger.debug(f"Got uploads playlist {uploads_playlist_id} for {channel_title}")
-            return uploads_playlist_id
-            
-        except HttpError as e:
-            if e.resp.status == 403 and "quotaExceeded" in str(e):
-                self.quota_exceeded = True
-                logger.warning("YouTube API quota exceeded while fetching channel details.")
-            else:
-                logger.warning(f"YouTube API error fetching channel {channel_title}: {e}")
-            return None
-        except Exception as e:
-            logger.warning(f"Unexpected error fetching channel {channel_title}: {e}")
-            return None
+            with open(self._uploads_cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to read uploads playlist cache: {e}")
+            return {}
 
-    def _get_recent_videos_from_uploads_playlist(
-        self, uploads_playlist_id: str, channel_title: str, max_results: int, published_after: str
-    ) -> List[Dict[str, Any]]:
-        """Get recent videos from a channel's uploads playlist."""
-        videos = []
-        
+    def _save_uploads_playlist_cache(self) -> None:
+        """Persist the channel_id -> uploads playlist ID cache."""
         try:
-            # Get recent playlist items (uploads are ordered by upload time)
-            playlist_items = self._get_playlist_items(
-                uploads_playlist_id, channel_title, max_results
-            )
+            with open(self._uploads_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._uploads_playlist_cache, f)
+        except OSError as e:
+            logger.warning(f"Failed to save uploads playlist cache: {e}")
 
-            if not playlist_items:
-                logger.debug(f"No recent videos found for {channel_title}")
-                return videos
+    def _get_uploads_playlist_ids(self, channel_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the uploads playlist IDs for many channels, 50 channels per API call.
 
-            # Step 3: Extract video IDs and get detailed information
-            video_ids = [item["contentDetails"]["videoId"] for item in playlist_items]
-            video_details = self._get_videos_details(video_ids)
+        Standard channel IDs ("UC...") map directly to their uploads playlist
+        ("UU..." with the same tail), and channels already in the on-disk
+        cache cost no API call either; only other new channels are looked up.
 
-            # Step 4: Filter by published date and combine with video details
-            from datetime import datetime
-            published_after_dt = datetime.fromisoformat(published_after.replace('Z', '+00:00'))
+        Args:
+            channel_ids: YouTube channel IDs
 
-            for item in playlist_items:
-                video_id = item["contentDetails"]["videoId"]
-                snippet = item["snippet"]
-                
-                # Filter by publish date (playlist items are ordered by upload date, 
-                # but we need to check the actual publish date)
-                published_at = datetime.fromisoformat(snippet["publishedAt"].replace('Z', '+00:00'))
-                if published_at <= published_after_dt:
-                    continue  # Skip older videos
-                
-                # Get video details if available
-                if video_id not in video_details:
-                    logger.debug(f"No details found for video {video_id}")
-                    continue
-                    
-                details = video_details[video_id]
-                
-                video_data = {
-                    "video_id": video_id,
-                    "title": snippet["title"],
-                    "channel_id": snippet["channelId"],
-                    "channel_title": channel_title,
-                    "published_at": snippet["publishedAt"],
-                    "duration_seconds": parse_duration_to_seconds(details["duration"]),
-                    "live_broadcast": details["liveBroadcastContent"]
-                }
-                videos.append(video_data)
-
-            if videos:
-                logger.debug(f"Found {len(videos)} recent videos from {channel_title}")
+        Returns:
+            Dict mapping channel_id to its uploads playlist ID; channels the
+            API returned no data for are missing
+        """
+        cache = self._uploads_playlist_cache
+        result = {}
+        missing_channel_ids = []
+        for channel_id in channel_ids:
+            if channel_id in cache:
+                result[channel_id] = cache[channel_id]
+            elif channel_id.startswith("UC"):
+                result[channel_id] = "UU" + channel_id[2:]
+            else:
+                missing_channel_ids.append(channel_id)
 
-            return videos
+        uploads_playlist_ids = {}
+        batch_size = 50
+
+        for i in range(0, len(missing_channel_ids), batch_size):
+            if self.quota_exceeded:
+                logger.warning("Skipping remaining channel batches due to quota exceeded")
+                break
+
+            batch = missing_channel_ids[i:i + batch_size]
+            try:
+                request = self.service.channels().list(
+                    part="contentDetails",
+                    id=",".join(batch),
+                    maxResults=batch_size,
+                    fields="items(id,contentDetails/relatedPlaylists/uploads)"
+                )
+
+                response = request.execute(http=self._thread_http())
+                track_api_call("channels.list")
+
+            except HttpError as e:
+                if e.resp.status == 403 and "quotaExceeded" in str(e):
+                    self.quota_exceeded = True
+                    logger.warning("YouTube API quota exceeded while fetching channel details.")
+                else:
+                    logger.warning(f"YouTube API error fetching channel batch: {e}")
+                continue
+            except Exception as e:
+                logger.warning(f"Unexpected error fetching channel batch: {e}")
+                continue
+
+            for item in response.get("items", []):
+                uploads_playlist_ids[item["id"]] = item["contentDetails"]["relatedPlaylists"]["uploads"]
+
+        if uploads_playlist_ids:
+            result.update(uploads_playlist_ids)
+            cache.update(uploads_playlist_ids)
+            self._save_uploads_playlist_cache()
+
+        logger.debug(
+            f"Got uploads playlists for {len(channel_ids) - len(missing_channel_ids)} channels "
+            f"from their IDs or the cache, {len(uploads_playlist_ids)}/{len(missing_channel_ids)} using "
+            f"{(len(missing_channel_ids) + batch_size - 1) // batch_size} channels.list calls"
+        )
+        return result
+
+    def _filter_recent_items(
+        self, playlist_items: List[Dict[str, Any]], channel_title: str, published_after: str
+    ) -> List[Dict[str, Any]]:
+        """Keep the uploads playlist items published after the cutoff."""
+        try:
+            # Filter by publish date before any details are fetched (playlist
+            # items are ordered by upload date, but we need to check the
+            # actual publish date)
+            recent_items = [
+                item for item in playlist_items
+                if _is_published_after(item["snippet"]["publishedAt"], published_after)
+            ]
+
+            if not recent_items:
+                logger.debug(f"No recent videos found for {channel_title}")
+
+            return recent_items
 
         except Exception as e:
             logger.warning(f"Error processing uploads for {channel_title}: {e}")
             return []
 
+    def _playlist_items_request(self, uploads_playlist_id: str, max_results: int):
+        """Build the playlistItems.list request for a channel's most recent uploads."""
+        return self.service.playlistItems().list(
+            part="snippet,contentDetails",
+            playlistId=uploads_playlist_id,
+            maxResults=min(max_results, 50),  # API limit is 50
+            fields="items(snippet(title,channelId,publishedAt),contentDetails/videoId)"
+        )
+
+    def _log_playlist_items_error(self, channel_title: str, e: HttpError) -> None:
+        """Log a failed playlist items request, noting exhausted quota."""
+        if e.resp.status == 403 and "quotaExceeded" in str(e):
+            self.quota_exceeded = True
+            logger.warning(f"YouTube API quota exceeded while fetching playlist items for {channel_title}.")
+        else:
+            logger.warning(f"YouTube API error fetching playlist items for {channel_title}: {e}")
+
     def _get_playlist_items(
         self, uploads_playlist_id: str, channel_title: str, max_results: int
     ) -> List[Dict[str, Any]]:
         """Get playlist items with error handling."""
         try:
-            request = self.service.playlistItems().list(
-                part="snippet,contentDetails",
-                playlistId=uploads_playlist_id,
-                maxResults=min(max_results, 50)  # API limit is 50
-            )
+            request = self._playlist_items_request(uploads_playlist_id, max_results)
             
-            response = request.execute()
+            response = request.execute(http=self._thread_http())
             track_api_call("playlistItems.list")
             return response.get("items", [])
             
         except HttpError as e:
-            if e.resp.status == 403 and "quotaExceeded" in str(e):
-                self.quota_exceeded = True
-                logger.warning(f"YouTube API quota exceeded while fetching playlist items for {channel_title}.")
-            else:
-                logger.warning(f"YouTube API error fetching playlist items for {channel_title}: {e}")
+            self._log_playlist_items_error(channel_title, e)
+            return []
+        except Exception as e:
+            # Network errors (a stall hitting the transport timeout, resets)
+            # only cost this one channel
+            logger.warning(f"Unexpected error fetching playlist items for {channel_title}: {e}")
             return []
 
+    def _get_playlist_items_batch(
+        self, channels: List[Tuple[str, str]], max_results: int
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Get playlist items for several channels in one batched HTTP request.
+
+        Quota is still charged per playlistItems.list call, but the whole
+        page of channels costs a single round trip. If the batch request
+        itself fails, channels without a response are fetched one by one.
+
+        Args:
+            channels: (channel title, uploads playlist ID) pairs, at most 50
+            max_results: Maximum items per playlist
+
+        Returns:
+            Playlist items per channel, in the order given
+        """
+        results = [[] for _ in channels]
+        answered = set()
+
+        def collect(request_id, response, exception):
+            index = int(request_id)
+            answered.add(index)
+            if isinstance(exception, HttpError):
+                self._log_playlist_items_error(channels[index][0], exception)
+                return
+            if exception is not None:
+                logger.warning(
+                    f"Unexpected error fetching playlist items for {channels[index][0]}: {exception}"
+                )
+                return
+            track_api_call("playlistItems.list")
+            results[index] = response.get("items", [])
+
+        try:
+            batch = self.service.new_batch_http_request(callback=collect)
+            for index, (_, uploads_playlist_id) in enumerate(channels):
+                batch.add(
+                    self._playlist_items_request(uploads_playlist_id, max_results),
+                    request_id=str(index)
+                )
+            batch.execute(http=self._thread_http())
+        except Exception as e:
+            logger.warning(f"Batched playlist items request failed, fetching channels individually: {e}")
+            for index, (channel_title, uploads_playlist_id) in enumerate(channels):
+                if index not in answered and not self.quota_exceeded:
+                    results[index] = self._get_playlist_items(
+                        uploads_playlist_id, channel_title, max_results
+                    )
+
+        return results
+
     def _get_videos_details_batch(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """
         Fetch video details for a batch of up to 50 video IDs with retry logic.
@@ -527,15 +994,16 @@ class YouTubeClient:
             logger.warning(f"Invalid batch size: {len(video_ids)}. Expected 1-50 video IDs.")
             return {}
             
-        max_retries = 1
+        max_retries = 3
         for attempt in range(max_retries + 1):
             try:
                 request = self.service.videos().list(
                     part="contentDetails,snippet", 
-                    id=",".join(video_ids)
+                    id=",".join(video_ids),
+                    fields="items(id,contentDetails/duration,snippet/liveBroadcastContent)"
                 )
                 
-                response = request.execute()
+                response = request.execute(http=self._thread_http())
                 track_api_call("videos.list")
                 batch_details = {}
                 
@@ -561,17 +1029,17 @@ class YouTubeClient:
                     logger.error("YouTube API quota exceeded while fetching video details.")
                     logger.error("Try again after 12AM Pacific Time.")
                     return {}
-                elif attempt < max_retries:
+                elif e.resp.status in RETRYABLE_STATUSES and attempt < max_retries:
                     logger.warning(f"YouTube API error fetching video batch (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                    time.sleep(1)  # Brief delay before retry
+                    time.sleep(_retry_delay(attempt))
                     continue
                 else:
-                    logger.error(f"YouTube API error fetching video details after {max_retries + 1} attempts: {e}")
+                    logger.error(f"YouTube API error fetching video details after {attempt + 1} attempts: {e}")
                     return {}
             except Exception as e:
                 if attempt < max_retries:
                     logger.warning(f"Unexpected error fetching video batch (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                    time.sleep(1)  # Brief delay before retry
+                    time.sleep(_retry_delay(attempt))
                     continue
                 else:
                     logger.error(f"Unexpected error fetching video details after {max_retries + 1} attempts: {e}")
@@ -601,6 +1069,20 @@ class YouTubeClient:
         if len(unique_video_ids) != len(video_ids):
             logger.debug(f"Removed {len(video_ids) - len(unique_video_ids)} duplicate video IDs")
 
+        # Reuse details already fetched during this run
+        cached_details = {
+            video_id: self._video_details_mem[video_id]
+            for video_id in unique_video_ids
+            if video_id in self._video_details_mem
+        }
+        if cached_details:
+            logger.debug(f"Reusing details for {len(cached_details)} videos fetched earlier this run")
+            unique_video_ids = [
+                video_id for video_id in unique_video_ids if video_id not in cached_details
+            ]
+            if not unique_video_ids:
+                return cached_details
+
         details = {}
         batch_size = 50
         total_batches = (len(unique_video_ids) + batch_size - 1) // batch_size
@@ -638,7 +1120,9 @@ class YouTubeClient:
         
         if failed_batches > 0:
             logger.warning(f"{failed_batches}/{total_batches} batches failed")
-            
+
+        self._video_details_mem.update(details)
+        details.update(cached_details)
         return details
 
     def get_or_create_playlist(
@@ -662,9 +1146,9 @@ class YouTubeClient:
             # Verify the playlist exists and is accessible
             try:
                 request = self.service.playlists().list(
-                    part="snippet", id=playlist_id
+                    part="snippet", id=playlist_id, fields="items/snippet/title"
                 )
-                response = request.execute()
+                response = request.execute(http=self._thread_http())
                 track_api_call("playlists.list")
 
                 if response.get("items"):
@@ -695,7 +1179,7 @@ class YouTubeClient:
             }
 
             request = self.service.playlists().insert(
-                part="snippet,status", body=playlist_body
+                part="snippet,status", body=playlist_body, fields="id"
             )
             
             response = request.execute()
@@ -727,52 +1211,162 @@ class YouTubeClient:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            playlist_item_body = {
-                "snippet": {
-                    "playlistId": playlist_id,
-                    "resourceId": {"kind": "youtube#video", "videoId": video_id},
-                }
-            }
+        max_retries = 3
+        attempt = 0
+        while True:
+            result = self._insert_playlist_item(playlist_id, video_id, attempt < max_retries)
+            if result is not None:
+                return result
+            time.sleep(_retry_delay(attempt))
+            attempt += 1
+
+    def _insert_playlist_item(
+        self, playlist_id: str, video_id: str, can_retry: bool
+    ) -> Optional[bool]:
+        """
+        Make one playlistItems.insert attempt.
 
-            request = self.service.playlistItems().insert(
-                part="snippet", body=playlist_item_body
-            )
+        Returns:
+            True if successful, False if failed, None if the attempt was
+            aborted by a concurrent write and should be retried
+        """
+        try:
+            request = self._playlist_item_insert_request(playlist_id, video_id)
 
-            response = request.execute()
-            track_api_call("playlistItems.insert")
-            logger.debug(f"Added video {video_id} to playlist {playlist_id}")
+            response = request.execute(http=self._thread_http())
+            self._record_playlist_insert(playlist_id, video_id)
             return True
 
         except HttpError as e:
-            # Handle common errors gracefully
-            if e.resp.status == 409:
-                logger.debug(f"Video {video_id} already in playlist {playlist_id}")
-                return True  # Consider duplicates as success
-            elif e.resp.status == 403 and "quotaExceeded" in str(e):
-                self.quota_exceeded = True
-                logger.warning("YouTube API quota exceeded while adding videos to playlist.")
-                logger.warning("Try again after 12AM Pacific Time.")
-                return False
-            else:
-                logger.warning(f"Failed to add video {video_id} to playlist: {e}")
-                return False
+            return self._playlist_insert_error_result(playlist_id, video_id, e, can_retry)
         except Exception as e:
             logger.warning(f"Unexpected error adding video {video_id} to playlist: {e}")
             return False
 
+    def _playlist_item_insert_request(self, playlist_id: str, video_id: str):
+        """Build the playlistItems.insert request adding a video to a playlist."""
+        playlist_item_body = {
+            "snippet": {
+                "playlistId": playlist_id,
+                "resourceId": {"kind": "youtube#video", "videoId": video_id},
+            }
+        }
+
+        return self.service.playlistItems().insert(
+            part="snippet", body=playlist_item_body, fields="id"
+        )
+
+    def _record_playlist_insert(self, playlist_id: str, video_id: str) -> None:
+        """Account for a successful playlistItems.insert."""
+        track_api_call("playlistItems.insert")
+        logger.debug(f"Added video {video_id} to playlist {playlist_id}")
+        self._remember_playlist_item(playlist_id, video_id)
+
+    def _playlist_insert_error_result(
+        self, playlist_id: str, video_id: str, e: HttpError, can_retry: bool
+    ) -> Optional[bool]:
+        """
+        Handle a failed playlistItems.insert.
+
+        Returns:
+            True if the video is in the playlist anyway, False if failed,
+            None if the insert was aborted by a concurrent write and should
+            be retried
+        """
+        # Handle common errors gracefully
+        if e.resp.status == 409 and "SERVICE_UNAVAILABLE" in str(e):
+            # "The operation was aborted": another write to the same
+            # playlist was in flight; the video was not added
+            if can_retry:
+                logger.debug(f"Insert of video {video_id} aborted by a concurrent write, retrying")
+                return None
+            logger.warning(f"Failed to add video {video_id} to playlist: {e}")
+            return False
+        elif e.resp.status == 409:
+            logger.debug(f"Video {video_id} already in playlist {playlist_id}")
+            self._remember_playlist_item(playlist_id, video_id)
+            return True  # Consider duplicates as success
+        elif e.resp.status == 403 and "quotaExceeded" in str(e):
+            self.quota_exceeded = True
+            logger.warning("YouTube API quota exceeded while adding videos to playlist.")
+            logger.warning("Try again after 12AM Pacific Time.")
+            return False
+        else:
+            logger.warning(f"Failed to add video {video_id} to playlist: {e}")
+            return False
+
+    def _insert_playlist_items_batch(
+        self, playlist_id: str, video_ids: List[str]
+    ) -> Dict[str, Optional[bool]]:
+        """
+        Add up to 50 videos to a playlist with one batched HTTP request.
+
+        Quota is still charged per insert, but the whole chunk costs a
+        single round trip. Nothing is sent once quota is exhausted.
+
+        Args:
+            playlist_id: Target playlist ID
+            video_ids: Distinct YouTube video IDs to add (max 50)
+
+        Returns:
+            Dict mapping video_id to success status; videos that are missing
+            or mapped to None got no usable answer (the batch request failed
+            or the insert was aborted) and should be retried individually
+        """
+        results = {}
+        if self.quota_exceeded:
+            return results
+
+        def collect(request_id, response, exception):
+            if exception is None:
+                self._record_playlist_insert(playlist_id, request_id)
+                results[request_id] = True
+            elif isinstance(exception, HttpError):
+                results[request_id] = self._playlist_insert_error_result(
+                    playlist_id, request_id, exception, can_retry=True
+                )
+            else:
+                logger.warning(f"Unexpected error adding video {request_id} to playlist: {exception}")
+                results[request_id] = False
+
+        batch = self.service.new_batch_http_request(callback=collect)
+        for video_id in video_ids:
+            batch.add(
+                self._playlist_item_insert_request(playlist_id, video_id),
+                request_id=video_id
+            )
+
+        try:
+            batch.execute(http=self._thread_http())
+        except Exception as e:
+            logger.warning(f"Batched playlist insert failed, adding videos individually: {e}")
+
+        return results
+
+    def _remember_playlist_item(self, playlist_id: str, video_id: str) -> None:
+        """Record a video now known to be in a playlist in the per-run memo."""
+        existing_video_ids = self._existing_items_mem.get(playlist_id)
+        if existing_video_ids is not None:
+            existing_video_ids.add(video_id)
+
     def add_videos_to_playlist(
         self, playlist_id: str, video_ids: List[str]
     ) -> Dict[str, bool]:
         """
         Add multiple videos to a playlist with duplicate detection and quota-aware early termination.
 
+        Videos are appended, but not necessarily in the order given: YouTube
+        doesn't promise to apply the inserts of one batched request in
+        order, and inserts aborted by a concurrent write are retried after
+        the rest of their batch.
+
         Args:
             playlist_id: Target playlist ID
             video_ids: List of YouTube video IDs to add
 
         Returns:
-            Dict mapping video_id to success status (True/False)
+            Dict mapping video_id to success status (True/False); videos not
+            sent because quota ran out map to False
         """
         if not video_ids:
             return {}
@@ -780,58 +1374,81 @@ class YouTubeClient:
         # Fetch existing playlist items to avoid duplicates
         existing_video_ids = self.fetch_existing_playlist_items(playlist_id)
         
-        # Filter out duplicates before attempting insertion
-        new_video_ids = []
-        skipped_duplicates = []
-        
-        for video_id in video_ids:
-            if video_id in existing_video_ids:
-                skipped_duplicates.append(video_id)
-                logger.info(f"Skipping duplicate video: {video_id}")
-            else:
-                new_video_ids.append(video_id)
-        
+        # Filter out duplicates before attempting insertion (order-preserving,
+        # also drops IDs repeated in the input). One C-level intersection
+        # settles the common none/all-duplicate cases without a Python loop.
+        requested = dict.fromkeys(video_ids)
+        duplicates = existing_video_ids.intersection(requested)
+        if not duplicates:
+            new_video_ids = list(requested)
+            skipped_duplicates = []
+        elif len(duplicates) == len(requested):
+            new_video_ids = []
+            skipped_duplicates = list(requested)
+        else:
+            new_video_ids = [video_id for video_id in requested if video_id not in duplicates]
+            skipped_duplicates = [video_id for video_id in requested if video_id in duplicates]
+
         # Log duplicate detection results
         if skipped_duplicates:
-            logger.info(f"Skipped {len(skipped_duplicates)} duplicate videos (quota saved: {len(skipped_duplicates) * 50} units)")
+            if logger.isEnabledFor(logging.INFO):
+                for video_id in skipped_duplicates:
+                    logger.info("Skipping duplicate video: %s", video_id)
+            logger.info(
+                "Skipped %d duplicate videos (quota saved: %d units)",
+                len(skipped_duplicates), len(skipped_duplicates) * 50
+            )
         
         if not new_video_ids:
             logger.info("All videos already exist in playlist - no insertions needed")
             # Return success for all videos since they're already in the playlist
             return {video_id: True for video_id in video_ids}
 
-        # Process only new videos
-        results = {}
-        
-        # Mark all skipped duplicates as successful (they're already in the playlist)
-        for video_id in skipped_duplicates:
-            results[video_id] = True
-
-        # Add only the new videos
-        logger.info(f"Adding {len(new_video_ids)} new videos to playlist")
-        for video_id in new_video_ids:
-            # Stop processing if quota was exceeded
-            if self.quota_exceeded:
-                logger.warning(f"Skipping remaining videos due to quota exceeded")
-                break
-                
-            success = self.add_video_to_playlist(playlist_id, video_id)
-            results[video_id] = success
-
-        successful = sum(results.values())
-        total_attempted = len([v for v in video_ids if v not in skipped_duplicates])
+        # Process only new videos. Mark all skipped duplicates as successful
+        # (they're already in the playlist) and count successes as they come in
+        results = dict.fromkeys(skipped_duplicates, True)
+        successful = len(skipped_duplicates)
+        skipped_for_quota = 0
+
+        # Add only the new videos, 50 inserts per batched HTTP request. Batches
+        # go out one at a time: writes to one playlist conflict with each
+        # other (409 aborts), and a later batch must not overtake retries of
+        # an earlier one or keep spending after quota runs out
+        logger.info("Adding %d new videos to playlist", len(new_video_ids))
+        batch_size = 50
+        for i in range(0, len(new_video_ids), batch_size):
+            batch = new_video_ids[i:i + batch_size]
+            batch_results = self._insert_playlist_items_batch(playlist_id, batch)
+            for video_id in batch:
+                success = batch_results.get(video_id)
+                if success is None:
+                    # Stop sending once quota is exceeded; the rest failed
+                    if self.quota_exceeded:
+                        results[video_id] = False
+                        skipped_for_quota += 1
+                        continue
+                    success = self.add_video_to_playlist(playlist_id, video_id)
+                results[video_id] = success
+                if success:
+                    successful += 1
+
+        if successful > len(skipped_duplicates):
+            self._refresh_playlist_cache(playlist_id)
+
+        total_attempted = len(new_video_ids)
         
-        if self.quota_exceeded and len(results) < len(video_ids):
-            processed = len(results) - len(skipped_duplicates)
+        if skipped_for_quota:
+            processed = total_attempted - skipped_for_quota
             logger.warning(
-                f"Quota exceeded: only processed {processed}/{total_attempted} new videos, "
-                f"{successful} total successful (including {len(skipped_duplicates)} pre-existing)"
+                "Quota exceeded: only processed %d/%d new videos, "
+                "%d total successful (including %d pre-existing)",
+                processed, total_attempted, successful, len(skipped_duplicates)
             )
         else:
             new_additions = successful - len(skipped_duplicates)
             logger.info(
-                f"Successfully processed {len(video_ids)} videos: "
-                f"{new_additions} newly added, {len(skipped_duplicates)} already existed"
+                "Successfully processed %d videos: %d newly added, %d already existed",
+                len(requested), new_additions, len(skipped_duplicates)
             )
 
         return results
\ No newline at end of file
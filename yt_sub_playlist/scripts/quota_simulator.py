@@ -10,6 +10,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from config.quota_costs import get_quota_cost
 
+try:
+    import orjson
+except ImportError:  # Optional speedup: `uv sync --extra fast`
+    orjson = None
+
 
 def load_api_call_log() -> dict:
     """
@@ -26,8 +31,8 @@ def load_api_call_log() -> dict:
     
     try:
         if log_path.exists():
-            with open(log_path, 'r') as f:
-                api_calls = json.load(f)
+            data = log_path.read_bytes()
+            api_calls = orjson.loads(data) if orjson is not None else json.loads(data)
             print(f"📄 Loaded API call counts from {log_path}")
             return api_calls
         else: